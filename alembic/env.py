@@ -12,6 +12,13 @@ fileConfig(config.config_file_name)
 
 target_metadata = Base.metadata
 
+# objets gérés uniquement par les migrations (absents des modèles)
+MIGRATION_ONLY_OBJECTS = {"search_vector", "ix_courses_search_vector"}
+
+
+def include_object(obj, name, type_, reflected, compare_to):
+    return not (reflected and name in MIGRATION_ONLY_OBJECTS)
+
 
 def run_migrations_online():
     configuration = config.get_section(config.config_ini_section)
@@ -28,6 +35,7 @@ def run_migrations_online():
             connection=connection,
             target_metadata=target_metadata,
             compare_type=True,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
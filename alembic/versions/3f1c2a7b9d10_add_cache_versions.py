@@ -0,0 +1,29 @@
+"""add cache versions
+
+Revision ID: 3f1c2a7b9d10
+Revises: 8877305a5ac3
+Create Date: 2026-10-17 09:12:04.512331
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+
+revision = '3f1c2a7b9d10'
+down_revision = '8877305a5ac3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('cache_versions',
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.execute("INSERT INTO cache_versions (name, version) VALUES ('catalog', 0)")
+
+
+def downgrade() -> None:
+    op.drop_table('cache_versions')
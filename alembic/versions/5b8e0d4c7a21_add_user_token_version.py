@@ -0,0 +1,24 @@
+"""add user token version
+
+Revision ID: 5b8e0d4c7a21
+Revises: 3f1c2a7b9d10
+Create Date: 2026-10-17 10:03:41.208815
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+
+revision = '5b8e0d4c7a21'
+down_revision = '3f1c2a7b9d10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('token_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'token_version')
@@ -0,0 +1,34 @@
+"""add course search vector
+
+Revision ID: 7c4d9e2f1b36
+Revises: 5b8e0d4c7a21
+Create Date: 2026-10-17 14:26:10.904417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+
+revision = '7c4d9e2f1b36'
+down_revision = '5b8e0d4c7a21'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # colonne générée (PostgreSQL >= 12) : titre > niveau > description
+    op.execute("""
+        ALTER TABLE courses ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('french', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('french', coalesce(level, '')), 'B') ||
+            setweight(to_tsvector('french', coalesce(description, '')), 'C')
+        ) STORED
+    """)
+    op.create_index('ix_courses_search_vector', 'courses', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_courses_search_vector', table_name='courses')
+    op.drop_column('courses', 'search_vector')
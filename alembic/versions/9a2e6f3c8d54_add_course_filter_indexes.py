@@ -0,0 +1,28 @@
+"""add course filter indexes
+
+Revision ID: 9a2e6f3c8d54
+Revises: 7c4d9e2f1b36
+Create Date: 2026-10-17 15:02:37.518204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+
+revision = '9a2e6f3c8d54'
+down_revision = '7c4d9e2f1b36'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_courses_published_id', 'courses', [sa.text('id DESC')], unique=False, postgresql_where=sa.text('published'))
+    op.create_index('ix_courses_level_price', 'courses', ['level', 'price_eur'], unique=False)
+    op.create_index('ix_courses_published_duration', 'courses', ['duration_minutes'], unique=False, postgresql_where=sa.text('published'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_courses_published_duration', table_name='courses')
+    op.drop_index('ix_courses_level_price', table_name='courses')
+    op.drop_index('ix_courses_published_id', table_name='courses')
@@ -0,0 +1,23 @@
+"""seed principals cache version
+
+Revision ID: a8d3f6b2c417
+Revises: f4a7c1e9b352
+Create Date: 2026-10-18 09:41:27.205913
+
+"""
+from alembic import op
+
+
+
+revision = 'a8d3f6b2c417'
+down_revision = 'f4a7c1e9b352'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("INSERT INTO cache_versions (name, version) VALUES ('principals', 0)")
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM cache_versions WHERE name = 'principals'")
@@ -0,0 +1,26 @@
+"""add course code
+
+Revision ID: c1d8a4e7f250
+Revises: 9a2e6f3c8d54
+Create Date: 2026-10-17 16:11:52.730941
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+
+revision = 'c1d8a4e7f250'
+down_revision = '9a2e6f3c8d54'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('courses', sa.Column('code', sa.String(length=64), nullable=True))
+    op.create_unique_constraint('uq_courses_code', 'courses', ['code'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_courses_code', 'courses', type_='unique')
+    op.drop_column('courses', 'code')
@@ -0,0 +1,39 @@
+"""add admin course counters view
+
+Revision ID: d3e9b5f1a6c8
+Revises: c1d8a4e7f250
+Create Date: 2026-10-17 17:20:05.118342
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+
+revision = 'd3e9b5f1a6c8'
+down_revision = 'c1d8a4e7f250'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # inscriptions par cours et par statut ; rafraîchie par app.core.admin_counters
+    op.execute("""
+        CREATE MATERIALIZED VIEW admin_course_counters AS
+        SELECT
+            c.id AS course_id,
+            c.title,
+            c.published,
+            count(e.id) FILTER (WHERE e.status = 'pending') AS pending,
+            count(e.id) FILTER (WHERE e.status = 'accepted') AS accepted,
+            count(e.id) FILTER (WHERE e.status = 'rejected') AS rejected
+        FROM courses c
+        LEFT JOIN enrollments e ON e.course_id = c.id
+        GROUP BY c.id
+    """)
+    # requis par REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute("CREATE UNIQUE INDEX ux_admin_course_counters_course_id ON admin_course_counters (course_id)")
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW admin_course_counters")
@@ -0,0 +1,28 @@
+"""add outbox delivered handlers
+
+Revision ID: f4a7c1e9b352
+Revises: e6b2c9d4f7a3
+Create Date: 2026-10-17 23:05:12.418306
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+
+revision = 'f4a7c1e9b352'
+down_revision = 'e6b2c9d4f7a3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('outbox_events', sa.Column('delivered', sa.JSON(), server_default=sa.text("'[]'"), nullable=False))
+    op.drop_index('ix_outbox_events_pending', table_name='outbox_events', postgresql_where=sa.text("status = 'pending'"))
+    op.create_index('ix_outbox_events_pending', 'outbox_events', ['available_at'], unique=False, postgresql_where=sa.text("status IN ('pending', 'processing')"))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outbox_events_pending', table_name='outbox_events', postgresql_where=sa.text("status IN ('pending', 'processing')"))
+    op.create_index('ix_outbox_events_pending', 'outbox_events', ['available_at'], unique=False, postgresql_where=sa.text("status = 'pending'"))
+    op.drop_column('outbox_events', 'delivered')
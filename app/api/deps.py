@@ -1,9 +1,10 @@
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from jose import jwt, JWTError
 
 from app.core.config import settings
+from app.core.principal_cache import Principal, principal_cache, shared_version_query
 from app.db.session import SessionLocal  # si tu as déjà un session.py
 from app.models.user import User
 
@@ -16,11 +17,21 @@ def get_db():
     finally:
         db.close()
 
-def get_current_user(request: Request, db: Session = Depends(get_db)) -> User:
+async def get_async_db():
+    # import local : le moteur async n'existe que si ASYNC_DB_ENABLED
+    from app.db.async_session import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def _decode_token(request: Request) -> dict:
     token = request.cookies.get("access_token")
     if not token:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
 
+    # import local : python-jose / cryptography hors du démarrage
+    from jose import JWTError, jwt
+
     try:
         payload = jwt.decode(token, settings.JWT_SECRET, algorithms=["HS256"])
         email = payload.get("sub")
@@ -29,13 +40,64 @@ def get_current_user(request: Request, db: Session = Depends(get_db)) -> User:
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
-    user = db.query(User).filter(User.email == email).first()
-    if not user or not user.is_active:
+    if payload.get("act") is False:
         raise HTTPException(status_code=401, detail="Invalid user")
 
+    return payload
+
+def _principal_for(user: User | None, token_version: int) -> Principal:
+    if not user or not user.is_active or user.token_version != token_version:
+        raise HTTPException(status_code=401, detail="Invalid user")
+
+    principal = Principal.from_user(user)
+    principal_cache.put(principal)
+    return principal
+
+def get_current_user(request: Request, db: Session = Depends(get_db)) -> Principal:
+    payload = _decode_token(request)
+    user_id = payload.get("uid")
+    token_version = payload.get("tv", 0)
+
+    if principal_cache.needs_version_check():
+        principal_cache.sync_version(db.execute(shared_version_query()).scalar() or 0)
+
+    # chemin rapide : utilisateur déjà vérifié récemment par ce worker
+    if user_id is not None:
+        principal = principal_cache.get(user_id, token_version)
+        if principal is not None:
+            return principal
+        user = db.get(User, user_id)
+    else:
+        # anciens tokens sans "uid"
+        user = db.query(User).filter(User.email == payload["sub"]).first()
+
+    return _principal_for(user, token_version)
+
+async def get_current_user_async(request: Request, db=Depends(get_async_db)) -> Principal:
+    payload = _decode_token(request)
+    user_id = payload.get("uid")
+    token_version = payload.get("tv", 0)
+
+    if principal_cache.needs_version_check():
+        principal_cache.sync_version((await db.execute(shared_version_query())).scalar() or 0)
+
+    if user_id is not None:
+        principal = principal_cache.get(user_id, token_version)
+        if principal is not None:
+            return principal
+        user = await db.get(User, user_id)
+    else:
+        result = await db.execute(select(User).where(User.email == payload["sub"]))
+        user = result.scalars().first()
+
+    return _principal_for(user, token_version)
+
+def require_admin(user: Principal = Depends(get_current_user)) -> Principal:
+    if user.role != "admin":
+        raise HTTPException(status_code=403, detail="Admin only")
     return user
 
-def require_admin(user: User = Depends(get_current_user)) -> User:
+async def require_admin_async(user: Principal = Depends(get_current_user_async)) -> Principal:
     if user.role != "admin":
         raise HTTPException(status_code=403, detail="Admin only")
     return user
@@ -0,0 +1,67 @@
+from fastapi import HTTPException, Query
+
+from app.models.course import Course
+from app.schemas.course import CourseOut
+
+
+class CourseFilters:
+    """
+    Filtres du catalogue : ?level=...&min_price=...&max_price=...
+    &min_duration=...&max_duration=...
+    Appliqués en SQL (index composites) ou sur le snapshot du cache catalogue.
+    """
+
+    def __init__(
+        self,
+        level: str | None = Query(None, max_length=50),
+        min_price: int | None = Query(None, ge=0),
+        max_price: int | None = Query(None, ge=0),
+        min_duration: int | None = Query(None, ge=0),
+        max_duration: int | None = Query(None, ge=0),
+    ) -> None:
+        if min_price is not None and max_price is not None and min_price > max_price:
+            raise HTTPException(status_code=400, detail="min_price > max_price")
+        if min_duration is not None and max_duration is not None and min_duration > max_duration:
+            raise HTTPException(status_code=400, detail="min_duration > max_duration")
+
+        self.level = level or None
+        self.min_price = min_price
+        self.max_price = max_price
+        self.min_duration = min_duration
+        self.max_duration = max_duration
+
+    @property
+    def active(self) -> bool:
+        return any(v is not None for v in self.key())
+
+    def key(self) -> tuple:
+        return (self.level, self.min_price, self.max_price, self.min_duration, self.max_duration)
+
+    def criteria(self) -> list:
+        # même ordre que l'index (level, price_eur)
+        criteria = []
+        if self.level is not None:
+            criteria.append(Course.level == self.level)
+        if self.min_price is not None:
+            criteria.append(Course.price_eur >= self.min_price)
+        if self.max_price is not None:
+            criteria.append(Course.price_eur <= self.max_price)
+        if self.min_duration is not None:
+            criteria.append(Course.duration_minutes >= self.min_duration)
+        if self.max_duration is not None:
+            criteria.append(Course.duration_minutes <= self.max_duration)
+        return criteria
+
+    def matches(self, course: CourseOut) -> bool:
+        return (
+            (self.level is None or course.level == self.level)
+            and (self.min_price is None or course.price_eur >= self.min_price)
+            and (self.max_price is None or course.price_eur <= self.max_price)
+            and (self.min_duration is None or course.duration_minutes >= self.min_duration)
+            and (self.max_duration is None or course.duration_minutes <= self.max_duration)
+        )
+
+    def apply(self, courses):
+        if not self.active:
+            return courses
+        return tuple(c for c in courses if self.matches(c))
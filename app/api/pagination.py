@@ -0,0 +1,78 @@
+from fastapi import HTTPException, Query, Response
+from pydantic import BaseModel
+
+from app.api.responses import json_response
+from app.core.config import settings
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 500
+
+
+class PageParams:
+    """
+    Pagination par curseur (keyset sur id décroissant) :
+    ?limit=...&cursor=<dernier id reçu>&fields=id,title,...
+    Le curseur de la page suivante est renvoyé dans l'en-tête X-Next-Cursor.
+    """
+
+    def __init__(
+        self,
+        limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+        cursor: int | None = Query(None, ge=1),
+        fields: str | None = None,
+    ) -> None:
+        self.limit = limit
+        self.cursor = cursor
+        self.fields = fields
+
+
+def parse_fields(fields: str | None, schema: type[BaseModel]) -> list[str] | None:
+    if not fields:
+        # FAST_JSON : toujours des colonnes, jamais d'entités ORM à revalider
+        return list(schema.model_fields) if settings.FAST_JSON else None
+
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in schema.model_fields]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+
+    # l'id sert de curseur, il est toujours renvoyé
+    if "id" not in requested:
+        requested.insert(0, "id")
+    return requested
+
+
+def keyset_page(query, id_column, cursor: int | None, limit: int):
+    if cursor is not None:
+        query = query.filter(id_column < cursor)
+    rows = query.order_by(id_column.desc()).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = rows[-1].id
+    return rows, next_cursor
+
+
+def sequence_page(items, cursor: int | None, limit: int):
+    """Même découpage que keyset_page pour une liste déjà triée par id décroissant."""
+    if cursor is not None:
+        items = [i for i in items if i.id < cursor]
+    page = list(items[:limit + 1])
+
+    next_cursor = None
+    if len(page) > limit:
+        page = page[:limit]
+        next_cursor = page[-1].id
+    return page, next_cursor
+
+
+def set_next_cursor(response: Response, next_cursor: int | str | None) -> None:
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+
+
+def projected_response(items: list[dict] | bytes, next_cursor: int | None) -> Response:
+    response = json_response(items)
+    set_next_cursor(response, next_cursor)
+    return response
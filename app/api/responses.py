@@ -0,0 +1,27 @@
+import json
+
+import orjson
+from fastapi import Response
+
+from app.core.config import settings
+
+
+def dumps(content) -> bytes:
+    if settings.FAST_JSON:
+        return orjson.dumps(content)
+    # même rendu que JSONResponse
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def json_response(content, headers: dict | None = None) -> Response:
+    """
+    Réponse JSON construite directement (sans response_model) :
+    content est déjà au format de sortie (dicts) ou déjà sérialisé (bytes).
+    """
+    body = content if isinstance(content, bytes) else dumps(content)
+    return Response(content=body, media_type="application/json", headers=headers)
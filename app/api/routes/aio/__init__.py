@@ -0,0 +1,8 @@
+# Versions async (AsyncSession) des routers /api, activées par ASYNC_DB_ENABLED.
+# Elles sont enregistrées avant les routers sync : une route absente ici
+# retombe sur sa version sync.
+from app.api.routes.aio.auth import router as auth_router
+from app.api.routes.aio.courses import router as courses_router
+from app.api.routes.aio.enrollments import router as enrollments_router
+
+__all__ = ["auth_router", "courses_router", "enrollments_router"]
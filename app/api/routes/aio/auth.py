@@ -0,0 +1,75 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_db
+from app.core.security import create_user_token
+from app.core.hashing import hash_password_async, verify_password_async
+from app.core.rate_limit import limit_auth_attempt
+from app.models.user import User
+from app.schemas.user import UserCreate, UserOut
+from app.schemas.token import Token
+
+router = APIRouter(
+    prefix="/auth",
+    tags=["auth"],
+    include_in_schema=False,
+)
+
+
+@router.post("/register", response_model=UserOut, status_code=201)
+async def register(
+    request: Request,
+    payload: UserCreate,
+    db: AsyncSession = Depends(get_async_db),
+):
+    limit_auth_attempt(request, "register", payload.email)
+
+    result = await db.execute(
+        select(User.id).where(User.email == payload.email)
+    )
+
+    if result.first():
+        raise HTTPException(
+            status_code=409,
+            detail="Email already registered",
+        )
+
+    user = User(
+        email=payload.email,
+        hashed_password=await hash_password_async(payload.password),
+        role="user",
+        is_active=True,
+    )
+
+    db.add(user)
+    await db.commit()
+    await db.refresh(user)
+
+    return user
+
+
+@router.post("/login", response_model=Token)
+async def login(
+    request: Request,
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+):
+    limit_auth_attempt(request, "login", form_data.username)
+
+    result = await db.execute(
+        select(User).where(User.email == form_data.username)
+    )
+    user = result.scalars().first()
+
+    if not user or not await verify_password_async(
+        form_data.password,
+        user.hashed_password
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid email or password",
+        )
+
+    return Token(access_token=create_user_token(user))
@@ -0,0 +1,129 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_db, require_admin_async
+from app.api.filters import CourseFilters
+from app.api.pagination import PageParams
+from app.api.routes import courses as sync_courses
+from app.core.catalog_cache import catalog_cache
+from app.models.course import Course
+from app.schemas.course import (
+    CourseCreate,
+    CourseUpdate,
+    CourseOut,
+)
+
+router = APIRouter(
+    prefix="/courses",
+    tags=["courses"],
+    include_in_schema=False,
+)
+
+
+async def _get_or_404(db: AsyncSession, course_id: int) -> Course:
+    course = await db.get(Course, course_id)
+
+    if not course:
+        raise HTTPException(
+            status_code=404,
+            detail="Course not found",
+        )
+
+    return course
+
+
+@router.get("", response_model=list[CourseOut])
+async def list_courses(
+    request: Request,
+    response: Response,
+    published_only: bool = True,
+    page: PageParams = Depends(),
+    filters: CourseFilters = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+):
+    # même logique (cache catalogue + pagination) que la version sync
+    return await db.run_sync(
+        lambda session: sync_courses.list_courses(request, response, published_only, page, filters, session)
+    )
+
+
+@router.get("/search", response_model=list[CourseOut])
+async def search(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    # à déclarer avant /{course_id}, qui capturerait "search"
+    return await db.run_sync(
+        lambda session: sync_courses.search(response, q, limit, cursor, session)
+    )
+
+
+@router.get("/{course_id}", response_model=CourseOut)
+async def get_course(
+    course_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+):
+    catalog = await db.run_sync(catalog_cache.get)
+    course = catalog.by_id.get(course_id) or await _get_or_404(db, course_id)
+    return sync_courses.course_response(request, course)
+
+
+@router.post(
+    "",
+    response_model=CourseOut,
+    status_code=201,
+    dependencies=[Depends(require_admin_async)],
+)
+async def create_course(
+    payload: CourseCreate,
+    db: AsyncSession = Depends(get_async_db),
+):
+    course = Course(**payload.model_dump())
+    db.add(course)
+    await db.run_sync(sync_courses._commit_course)
+    await db.refresh(course)
+    await db.run_sync(catalog_cache.invalidate)
+    return course
+
+
+@router.patch(
+    "/{course_id}",
+    response_model=CourseOut,
+    dependencies=[Depends(require_admin_async)],
+)
+async def update_course(
+    course_id: int,
+    payload: CourseUpdate,
+    db: AsyncSession = Depends(get_async_db),
+):
+    course = await _get_or_404(db, course_id)
+
+    updates = payload.model_dump(exclude_unset=True)
+    for key, value in updates.items():
+        setattr(course, key, value)
+
+    await db.run_sync(sync_courses._commit_course)
+    await db.refresh(course)
+    await db.run_sync(catalog_cache.invalidate)
+    return course
+
+
+@router.delete(
+    "/{course_id}",
+    status_code=204,
+    dependencies=[Depends(require_admin_async)],
+)
+async def delete_course(
+    course_id: int,
+    db: AsyncSession = Depends(get_async_db),
+):
+    course = await _get_or_404(db, course_id)
+
+    await db.delete(course)
+    await db.commit()
+    await db.run_sync(catalog_cache.invalidate)
+    return None
@@ -0,0 +1,82 @@
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_db, get_current_user_async, require_admin_async
+from app.api.pagination import PageParams
+from app.api.routes import enrollments as sync_enrollments
+from app.core.enrollments import enroll
+from app.core.principal_cache import Principal
+from app.models.enrollment import Enrollment
+from app.schemas.enrollment import (
+    EnrollmentBulkResult,
+    EnrollmentBulkUpdate,
+    EnrollmentCreate,
+    EnrollmentOut,
+    EnrollmentUpdate,
+)
+
+router = APIRouter(
+    prefix="/enrollments",
+    tags=["enrollments"],
+    include_in_schema=False,
+)
+
+
+@router.post("", response_model=EnrollmentOut)
+async def create_enrollment(
+    payload: EnrollmentCreate,
+    db: AsyncSession = Depends(get_async_db),
+    user: Principal = Depends(get_current_user_async),
+):
+    e, _ = await db.run_sync(
+        lambda session: enroll(session, user.id, payload.course_id)
+    )
+    return e
+
+
+@router.get("/me", response_model=list[EnrollmentOut])
+async def my_enrollments(
+    response: Response,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+    user: Principal = Depends(get_current_user_async),
+):
+    return await db.run_sync(
+        lambda session: sync_enrollments._list_enrollments(page, response, session, Enrollment.user_id == user.id)
+    )
+
+
+@router.get("/admin", response_model=list[EnrollmentOut])
+async def admin_list(
+    response: Response,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+    admin: Principal = Depends(require_admin_async),
+):
+    return await db.run_sync(
+        lambda session: sync_enrollments._list_enrollments(page, response, session)
+    )
+
+
+@router.post("/admin/bulk", response_model=EnrollmentBulkResult)
+async def admin_bulk_update(
+    payload: EnrollmentBulkUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    admin: Principal = Depends(require_admin_async),
+):
+    return await db.run_sync(
+        lambda session: sync_enrollments.admin_bulk_update(payload, session, admin)
+    )
+
+
+@router.patch("/admin/{enrollment_id}", response_model=EnrollmentOut)
+async def admin_update(
+    enrollment_id: int,
+    payload: EnrollmentUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    admin: Principal = Depends(require_admin_async),
+):
+    # même validation et mêmes effets (compteurs admin) que la version sync
+    return await db.run_sync(
+        lambda session: sync_enrollments.admin_update(enrollment_id, payload, session, admin)
+    )
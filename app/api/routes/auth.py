@@ -1,14 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
-from app.core.security import (
-    hash_password,
-    verify_password,
-    create_access_token,
-)
+from app.core.security import create_user_token
+from app.core.hashing import hash_password_async, verify_password_async
+from app.core.rate_limit import limit_auth_attempt
 from app.models.user import User
 from app.schemas.user import UserCreate, UserOut
 from app.schemas.token import Token
@@ -20,13 +19,16 @@ router = APIRouter(
 
 
 @router.post("/register", response_model=UserOut, status_code=201)
-def register(
+async def register(
+    request: Request,
     payload: UserCreate,
     db: Session = Depends(get_db),
 ):
-    existing_user = db.query(User).filter(
-        User.email == payload.email
-    ).first()
+    limit_auth_attempt(request, "register", payload.email)
+
+    existing_user = await run_in_threadpool(
+        lambda: db.query(User).filter(User.email == payload.email).first()
+    )
 
     if existing_user:
         raise HTTPException(
@@ -36,28 +38,34 @@ def register(
 
     user = User(
         email=payload.email,
-        hashed_password=hash_password(payload.password),
+        hashed_password=await hash_password_async(payload.password),
         role="user",
         is_active=True,
     )
 
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    def save():
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+
+    await run_in_threadpool(save)
 
     return user
 
 
 @router.post("/login", response_model=Token)
-def login(
+async def login(
+    request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db),
 ):
-    user = db.query(User).filter(
-        User.email == form_data.username
-    ).first()
+    limit_auth_attempt(request, "login", form_data.username)
 
-    if not user or not verify_password(
+    user = await run_in_threadpool(
+        lambda: db.query(User).filter(User.email == form_data.username).first()
+    )
+
+    if not user or not await verify_password_async(
         form_data.password,
         user.hashed_password
     ):
@@ -66,9 +74,6 @@ def login(
             detail="Invalid email or password",
         )
 
-    access_token = create_access_token(
-        subject=user.email,
-        role=user.role,
-    )
+    access_token = create_user_token(user)
 
     return Token(access_token=access_token)
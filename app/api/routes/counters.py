@@ -0,0 +1,17 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db, require_admin
+from app.core.admin_counters import admin_counters
+from app.schemas.admin import AdminCountersOut
+
+router = APIRouter(
+    prefix="/admin/counters",
+    tags=["admin"],
+    dependencies=[Depends(require_admin)],
+)
+
+
+@router.get("", response_model=AdminCountersOut)
+def get_counters(db: Session = Depends(get_db)):
+    return admin_counters.get(db)
@@ -1,13 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, require_admin
+from app.api.filters import CourseFilters
+from app.api.pagination import (
+    PageParams,
+    parse_fields,
+    keyset_page,
+    sequence_page,
+    set_next_cursor,
+    projected_response,
+)
+from app.core.catalog_cache import catalog_cache
+from app.core.config import settings
+from app.core.course_search import search_courses
 from app.models.course import Course
 from app.schemas.course import (
     CourseCreate,
     CourseUpdate,
     CourseOut,
 )
+from app.web.conditional import cache_headers, is_not_modified, make_etag, not_modified_response
 
 router = APIRouter(
     prefix="/courses",
@@ -17,25 +31,87 @@ router = APIRouter(
 
 @router.get("", response_model=list[CourseOut])
 def list_courses(
+    request: Request,
+    response: Response,
     published_only: bool = True,
+    page: PageParams = Depends(),
+    filters: CourseFilters = Depends(),
     db: Session = Depends(get_db),
 ):
-    query = db.query(Course)
+    fields = parse_fields(page.fields, CourseOut)
 
     if published_only:
-        query = query.filter(Course.published == True)  # noqa: E712
+        catalog = catalog_cache.get(db)
 
-    return query.order_by(Course.id.desc()).all()
+        # ETag = contenu du catalogue + paramètres de la page et filtres
+        etag = make_etag(
+            f"{catalog.digest}|{page.limit}|{page.cursor}|{','.join(fields or [])}|{filters.key()}".encode()
+        )
+        headers = cache_headers(etag, settings.CACHE_CONTROL_CATALOG)
+        if is_not_modified(request, etag):
+            return not_modified_response(headers)
+
+        items, next_cursor = sequence_page(filters.apply(catalog.courses), page.cursor, page.limit)
+        if fields == list(CourseOut.model_fields):
+            # liste complète : JSON pré-sérialisé par le cache catalogue
+            body = b"[" + b",".join(catalog.json_by_id[c.id] for c in items) + b"]"
+            projected = projected_response(body, next_cursor)
+            projected.headers.update(headers)
+            return projected
+        if fields:
+            projected = projected_response(
+                [c.model_dump(include=set(fields)) for c in items], next_cursor
+            )
+            projected.headers.update(headers)
+            return projected
+        set_next_cursor(response, next_cursor)
+        response.headers.update(headers)
+        return items
+
+    if fields:
+        query = db.query(*[getattr(Course, f) for f in fields]).filter(*filters.criteria())
+        rows, next_cursor = keyset_page(query, Course.id, page.cursor, page.limit)
+        return projected_response([dict(r._mapping) for r in rows], next_cursor)
+
+    query = db.query(Course).filter(*filters.criteria())
+    items, next_cursor = keyset_page(query, Course.id, page.cursor, page.limit)
+    set_next_cursor(response, next_cursor)
+    return items
+
+
+@router.get("/search", response_model=list[CourseOut])
+def search(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    db: Session = Depends(get_db),
+):
+    items, next_cursor = search_courses(db, q, limit, cursor)
+    set_next_cursor(response, next_cursor)
+    return items
+
+
+def course_response(request: Request, course) -> Response:
+    body = CourseOut.model_validate(course).model_dump_json().encode()
+    headers = cache_headers(make_etag(body), settings.CACHE_CONTROL_COURSE)
+    if is_not_modified(request, headers["ETag"]):
+        return not_modified_response(headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get("/{course_id}", response_model=CourseOut)
 def get_course(
     course_id: int,
+    request: Request,
     db: Session = Depends(get_db),
 ):
-    course = db.query(Course).filter(
-        Course.id == course_id
-    ).first()
+    # cours publiés : servis depuis le cache catalogue
+    course = catalog_cache.get(db).by_id.get(course_id)
+    if course is None:
+        course = db.query(Course).filter(
+            Course.id == course_id
+        ).first()
 
     if not course:
         raise HTTPException(
@@ -43,7 +119,16 @@ def get_course(
             detail="Course not found",
         )
 
-    return course
+    return course_response(request, course)
+
+
+def _commit_course(db: Session) -> None:
+    # seule contrainte unique des cours : code
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Course code already exists")
 
 
 @router.post(
@@ -58,8 +143,9 @@ def create_course(
 ):
     course = Course(**payload.model_dump())
     db.add(course)
-    db.commit()
+    _commit_course(db)
     db.refresh(course)
+    catalog_cache.invalidate(db)
     return course
 
 
@@ -87,8 +173,9 @@ def update_course(
     for key, value in updates.items():
         setattr(course, key, value)
 
-    db.commit()
+    _commit_course(db)
     db.refresh(course)
+    catalog_cache.invalidate(db)
     return course
 
 
@@ -113,4 +200,5 @@ def delete_course(
 
     db.delete(course)
     db.commit()
+    catalog_cache.invalidate(db)
     return None
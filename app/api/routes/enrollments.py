@@ -1,47 +1,66 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
+from app.api.pagination import PageParams, parse_fields, keyset_page, set_next_cursor, projected_response
 from app.models.enrollment import Enrollment
-from app.models.course import Course
-from app.models.user import User
+from app.core.principal_cache import Principal
 from app.api.deps import get_current_user, require_admin
-from app.schemas.enrollment import EnrollmentCreate, EnrollmentOut, EnrollmentUpdate
+from app.core.admin_counters import admin_counters
+from app.core.enrollments import enroll, set_enrollment_status
+from app.core.moderation import bulk_set_enrollment_status
+from app.schemas.enrollment import (
+    EnrollmentBulkResult,
+    EnrollmentBulkUpdate,
+    EnrollmentCreate,
+    EnrollmentOut,
+    EnrollmentUpdate,
+)
 
 router = APIRouter(prefix="/enrollments", tags=["enrollments"])
 
 @router.post("", response_model=EnrollmentOut)
-def create_enrollment(payload: EnrollmentCreate, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    course = db.query(Course).filter(Course.id == payload.course_id, Course.published == True).first()
-    if not course:
-        raise HTTPException(status_code=404, detail="Course not found")
+def create_enrollment(payload: EnrollmentCreate, db: Session = Depends(get_db), user: Principal = Depends(get_current_user)):
+    # déjà inscrit : même réponse (idempotent, y compris sous clics concurrents)
+    e, _ = enroll(db, user.id, payload.course_id)
+    return e
 
-    existing = db.query(Enrollment).filter(Enrollment.user_id == user.id, Enrollment.course_id == payload.course_id).first()
-    if existing:
-        return existing
+def _list_enrollments(page: PageParams, response: Response, db: Session, *criteria):
+    fields = parse_fields(page.fields, EnrollmentOut)
+    if fields:
+        query = db.query(*[getattr(Enrollment, f) for f in fields]).filter(*criteria)
+        rows, next_cursor = keyset_page(query, Enrollment.id, page.cursor, page.limit)
+        return projected_response([dict(r._mapping) for r in rows], next_cursor)
 
-    e = Enrollment(user_id=user.id, course_id=payload.course_id, status="pending")
-    db.add(e)
-    db.commit()
-    db.refresh(e)
-    return e
+    query = db.query(Enrollment).filter(*criteria)
+    rows, next_cursor = keyset_page(query, Enrollment.id, page.cursor, page.limit)
+    set_next_cursor(response, next_cursor)
+    return rows
 
 @router.get("/me", response_model=list[EnrollmentOut])
-def my_enrollments(db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    return db.query(Enrollment).filter(Enrollment.user_id == user.id).order_by(Enrollment.id.desc()).all()
+def my_enrollments(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db), user: Principal = Depends(get_current_user)):
+    return _list_enrollments(page, response, db, Enrollment.user_id == user.id)
 
 @router.get("/admin", response_model=list[EnrollmentOut])
-def admin_list(db: Session = Depends(get_db), admin: User = Depends(require_admin)):
-    return db.query(Enrollment).order_by(Enrollment.id.desc()).all()
+def admin_list(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db), admin: Principal = Depends(require_admin)):
+    return _list_enrollments(page, response, db)
+
+@router.post("/admin/bulk", response_model=EnrollmentBulkResult)
+def admin_bulk_update(payload: EnrollmentBulkUpdate, db: Session = Depends(get_db), admin: Principal = Depends(require_admin)):
+    rows = bulk_set_enrollment_status(
+        db, payload.status, payload.ids, payload.course_id, payload.current_status, admin_id=admin.id
+    )
+    return {"updated": len(rows), "enrollments": [dict(r._mapping) for r in rows]}
 
 @router.patch("/admin/{enrollment_id}", response_model=EnrollmentOut)
-def admin_update(enrollment_id: int, payload: EnrollmentUpdate, db: Session = Depends(get_db), admin: User = Depends(require_admin)):
+def admin_update(enrollment_id: int, payload: EnrollmentUpdate, db: Session = Depends(get_db), admin: Principal = Depends(require_admin)):
     e = db.query(Enrollment).filter(Enrollment.id == enrollment_id).first()
     if not e:
         raise HTTPException(status_code=404, detail="Enrollment not found")
     if payload.status not in ("pending", "accepted", "rejected"):
         raise HTTPException(status_code=400, detail="Invalid status")
-    e.status = payload.status
+    set_enrollment_status(db, e, payload.status, admin.id)
     db.commit()
+    admin_counters.invalidate()
     db.refresh(e)
     return e
@@ -0,0 +1,35 @@
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_current_user, get_db
+from app.core.live_events import TooManyStreamsError, broker, stream
+from app.core.principal_cache import Principal
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+
+@router.get("/enrollments")
+async def enrollment_events(user: Principal = Depends(get_current_user), db: Session = Depends(get_db)):
+    """
+    Flux SSE (text/event-stream) des changements d'inscription :
+    les siennes pour un élève, toutes pour un admin.
+    """
+    # la connexion dure longtemps : on rend la session tout de suite
+    # (hors de la boucle : close() peut émettre un ROLLBACK bloquant)
+    await run_in_threadpool(db.close)
+    try:
+        sub = broker.subscribe(user.id, user.role == "admin")
+    except TooManyStreamsError:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many live connections",
+            headers={"Retry-After": "30"},
+        )
+
+    return StreamingResponse(
+        stream(sub),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,124 @@
+import csv
+import io
+import json
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+
+from app.api.deps import require_admin
+from app.db.session import SessionLocal
+from app.models.course import Course
+from app.models.enrollment import Enrollment
+from app.models.user import User
+
+router = APIRouter(
+    prefix="/admin/export",
+    tags=["exports"],
+    dependencies=[Depends(require_admin)],
+)
+
+EXPORT_BATCH_SIZE = 1000
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _plain(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _stream_rows(stmt, fmt: str):
+    """
+    Parcourt le résultat avec un curseur côté serveur, par lots de
+    EXPORT_BATCH_SIZE lignes : la mémoire reste constante quelle que
+    soit la taille de l'export.
+    La session est ouverte ici car la réponse est envoyée après la
+    fermeture des dépendances.
+    """
+    db = SessionLocal()
+    try:
+        result = db.execute(
+            stmt.execution_options(stream_results=True, yield_per=EXPORT_BATCH_SIZE)
+        )
+        columns = list(result.keys())
+
+        if fmt == "csv":
+            buf = io.StringIO()
+            writer = csv.writer(buf)
+            writer.writerow(columns)
+            yield buf.getvalue()
+            for batch in result.partitions():
+                buf.seek(0)
+                buf.truncate()
+                writer.writerows([_plain(v) for v in row] for row in batch)
+                yield buf.getvalue()
+        else:
+            for batch in result.partitions():
+                yield "".join(
+                    json.dumps(
+                        {k: _plain(v) for k, v in zip(columns, row)},
+                        ensure_ascii=False,
+                    ) + "\n"
+                    for row in batch
+                )
+    finally:
+        db.close()
+
+
+def _export_response(stmt, fmt: str, name: str) -> StreamingResponse:
+    return StreamingResponse(
+        _stream_rows(stmt, fmt),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{fmt}"'},
+    )
+
+
+@router.get("/enrollments")
+def export_enrollments(
+    fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    status: str | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+):
+    stmt = (
+        select(
+            Enrollment.id,
+            Enrollment.status,
+            Enrollment.created_at,
+            Enrollment.user_id,
+            User.email.label("user_email"),
+            Enrollment.course_id,
+            Course.title.label("course_title"),
+        )
+        .join(User, User.id == Enrollment.user_id)
+        .join(Course, Course.id == Enrollment.course_id)
+        .order_by(Enrollment.id)
+    )
+
+    if status:
+        stmt = stmt.where(Enrollment.status == status)
+    if created_from:
+        stmt = stmt.where(Enrollment.created_at >= created_from)
+    if created_to:
+        stmt = stmt.where(Enrollment.created_at < created_to)
+
+    return _export_response(stmt, fmt, "enrollments")
+
+
+@router.get("/users")
+def export_users(
+    fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    role: str | None = None,
+):
+    stmt = select(User.id, User.email, User.role, User.is_active).order_by(User.id)
+
+    if role:
+        stmt = stmt.where(User.role == role)
+
+    return _export_response(stmt, fmt, "users")
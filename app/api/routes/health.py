@@ -0,0 +1,86 @@
+import hmac
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_current_user, get_db, require_admin
+from app.core.config import settings
+from app.core.startup import startup_timings
+from app.core.hashing import hashing_pool
+from app.core.live_events import broker
+from app.core.outbox import outbox_worker
+from app.core.rate_limit import rate_limiter
+from app.db.pool import pool_stats
+from app.db.session import get_engine
+from app.web.metrics import metrics_registry
+
+
+def require_internal_access(request: Request, db: Session = Depends(get_db)) -> None:
+    """Capacité et files internes : Bearer METRICS_TOKEN (scraper) ou session admin."""
+    if settings.METRICS_TOKEN:
+        expected = f"Bearer {settings.METRICS_TOKEN}"
+        if hmac.compare_digest(request.headers.get("authorization", ""), expected):
+            return
+    require_admin(get_current_user(request, db))
+
+
+router = APIRouter()
+# tout sauf /health (sonde de vie publique)
+internal = APIRouter(dependencies=[Depends(require_internal_access)])
+
+@router.get("/health")
+def health():
+    return {"status": "ok"}
+
+@internal.get("/health/startup")
+def health_startup():
+    return startup_timings
+
+@internal.get("/health/db-pool")
+def health_db_pool():
+    stats = pool_stats(get_engine().pool)
+    if settings.ASYNC_DB_ENABLED:
+        from app.db.async_session import async_engine
+
+        stats["async"] = pool_stats(async_engine.sync_engine.pool)
+    return stats
+
+@internal.get("/health/hashing")
+def health_hashing():
+    return hashing_pool.stats()
+
+@internal.get("/health/outbox")
+def health_outbox():
+    return outbox_worker.stats()
+
+@internal.get("/health/events")
+def health_events():
+    return broker.stats()
+
+@internal.get("/health/rate-limit")
+def health_rate_limit():
+    return rate_limiter.stats()
+
+@internal.get("/metrics", include_in_schema=False)
+def metrics():
+    gauges = {}
+    for key, value in pool_stats(get_engine().pool).items():
+        if isinstance(value, (int, float)):
+            gauges[f"db_pool_{key}"] = value
+    for key, value in hashing_pool.stats().items():
+        gauges[f"hashing_{key}"] = value
+    for key, value in rate_limiter.stats().items():
+        gauges[f"rate_limit_{key}"] = value
+    for key, value in outbox_worker.stats().items():
+        gauges[f"outbox_{key}"] = int(value)
+    for key, value in broker.stats().items():
+        gauges[f"sse_{key}"] = value
+
+    return PlainTextResponse(
+        metrics_registry.render(gauges),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
+router.include_router(internal)
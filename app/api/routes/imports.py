@@ -0,0 +1,183 @@
+import csv
+import io
+import json
+import time
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+
+from app.api.deps import require_admin
+from app.core.catalog_cache import catalog_cache
+from app.db.dialect import dialect_insert
+from app.db.session import SessionLocal
+from app.models.course import Course
+from app.schemas.course import CourseCreate
+
+router = APIRouter(
+    prefix="/admin/import",
+    tags=["imports"],
+    dependencies=[Depends(require_admin)],
+)
+
+IMPORT_BATCH_SIZE = 500
+IMPORT_MAX_BYTES = 20 * 1024 * 1024
+
+UPSERT_COLUMNS = [f for f in CourseCreate.model_fields if f != "code"]
+
+
+def _parse_rows(body: str, fmt: str):
+    """(numéro de ligne, dict brut ou erreur de parsing)."""
+    if fmt == "csv":
+        reader = csv.DictReader(io.StringIO(body))
+        for row in reader:
+            # cellule vide = valeur par défaut du schéma
+            yield reader.line_num, {k: v for k, v in row.items() if k and v not in ("", None)}
+        return
+
+    for line_no, line in enumerate(body.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as exc:
+            yield line_no, ValueError(f"invalid JSON: {exc}")
+            continue
+        if not isinstance(row, dict):
+            yield line_no, ValueError("expected a JSON object")
+            continue
+        yield line_no, row
+
+
+def _upsert_statement(dialect: str):
+    stmt = dialect_insert(dialect)(Course)
+    return stmt.on_conflict_do_update(
+        index_elements=[Course.code],
+        set_={c: stmt.excluded[c] for c in UPSERT_COLUMNS},
+    )
+
+
+def _write_batch(db, batch: list[tuple[int, dict]]) -> tuple[int, int]:
+    """Un lot = une transaction, codes uniques (voir _import_courses). Retourne (insérés, mis à jour)."""
+    by_code = {row["code"]: row for _, row in batch if row.get("code")}
+    plain = [row for _, row in batch if not row.get("code")]
+
+    existing = set()
+    if by_code:
+        existing = set(db.scalars(select(Course.code).where(Course.code.in_(by_code))))
+        db.execute(_upsert_statement(db.get_bind().dialect.name), list(by_code.values()))
+    if plain:
+        db.execute(insert(Course), plain)
+    db.commit()
+
+    return len(plain) + len(by_code) - len(existing), len(existing)
+
+
+def _line(payload: dict) -> str:
+    return json.dumps(payload, ensure_ascii=False) + "\n"
+
+
+def _import_courses(body: str, fmt: str):
+    """
+    Valide chaque ligne avec CourseCreate puis écrit par lots de
+    IMPORT_BATCH_SIZE (INSERT ... ON CONFLICT (code) DO UPDATE).
+    Renvoie en NDJSON les erreurs au fil de l'eau puis un récapitulatif.
+    """
+    started = time.perf_counter()
+    counts = {"rows": 0, "inserted": 0, "updated": 0, "errors": 0}
+    db = SessionLocal()
+    try:
+        batch: list[tuple[int, dict]] = []
+        # code -> position dans le lot
+        batch_codes: dict[str, int] = {}
+
+        def flush():
+            try:
+                inserted, updated = _write_batch(db, batch)
+            except Exception as exc:
+                db.rollback()
+                counts["errors"] += len(batch)
+                lines = [line_no for line_no, _ in batch]
+                return _line({"lines": [lines[0], lines[-1]], "error": f"batch failed: {exc.__class__.__name__}"})
+            counts["inserted"] += inserted
+            counts["updated"] += updated
+            return None
+
+        for line_no, raw in _parse_rows(body, fmt):
+            counts["rows"] += 1
+            if isinstance(raw, Exception):
+                counts["errors"] += 1
+                yield _line({"line": line_no, "error": str(raw)})
+                continue
+            try:
+                row = CourseCreate.model_validate(raw).model_dump()
+            except ValidationError as exc:
+                counts["errors"] += 1
+                yield _line({"line": line_no, "error": exc.errors(include_url=False, include_context=False)})
+                continue
+
+            code = row.get("code")
+            if code in batch_codes:
+                # ON CONFLICT ne peut pas toucher deux fois la même ligne :
+                # la dernière occurrence l'emporte, la précédente est signalée
+                position = batch_codes[code]
+                counts["errors"] += 1
+                yield _line({
+                    "line": batch[position][0],
+                    "error": f"duplicate code {code!r}, superseded by line {line_no}",
+                })
+                batch[position] = (line_no, row)
+                continue
+            if code:
+                batch_codes[code] = len(batch)
+
+            batch.append((line_no, row))
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                error = flush()
+                batch, batch_codes = [], {}
+                if error:
+                    yield error
+
+        if batch:
+            error = flush()
+            if error:
+                yield error
+    finally:
+        try:
+            # aussi si le client se déconnecte en cours de flux :
+            # les lots déjà validés doivent apparaître dans le catalogue
+            if counts["inserted"] or counts["updated"]:
+                catalog_cache.invalidate(db)
+        finally:
+            db.close()
+
+    seconds = time.perf_counter() - started
+    yield _line({
+        "summary": {
+            **counts,
+            "seconds": round(seconds, 3),
+            "rows_per_second": round(counts["rows"] / seconds, 1) if seconds else None,
+        }
+    })
+
+
+@router.post("/courses")
+async def import_courses(
+    request: Request,
+    fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+):
+    # corps lu avant de répondre : la réponse en streaming ne peut plus lire la requête
+    chunks, size = [], 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > IMPORT_MAX_BYTES:
+            raise HTTPException(status_code=413, detail="Import too large")
+        chunks.append(chunk)
+
+    try:
+        body = b"".join(chunks).decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="Import must be UTF-8")
+
+    return StreamingResponse(_import_courses(body, fmt), media_type="application/x-ndjson")
@@ -0,0 +1,190 @@
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import case, func, select, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.course import Course
+from app.models.enrollment import Enrollment
+from app.models.user import User
+
+logger = logging.getLogger("app.admin_counters")
+
+# vue matérialisée PostgreSQL (migration d3e9b5f1a6c8)
+MATVIEW = "admin_course_counters"
+
+# clé arbitraire pour pg_try_advisory_xact_lock : un seul worker rafraîchit la vue
+MATVIEW_REFRESH_LOCK_ID = 72_410_002
+
+
+@dataclass(frozen=True)
+class CourseCounters:
+    course_id: int
+    title: str
+    published: bool
+    pending: int
+    accepted: int
+    rejected: int
+
+
+@dataclass(frozen=True)
+class AdminCounters:
+    pending: int
+    accepted: int
+    rejected: int
+    courses: int
+    users: int
+    per_course: tuple[CourseCounters, ...]
+    refreshed_at: datetime
+    loaded_at: float
+
+
+def _use_matview(db: Session) -> bool:
+    return db.get_bind().dialect.name == "postgresql" and settings.ADMIN_COUNTERS_MATVIEW
+
+
+def _refresh_matview(db: Session) -> None:
+    """Session dédiée (tâche de fond) ; les autres workers lisent la vue telle quelle."""
+    locked = db.execute(
+        text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": MATVIEW_REFRESH_LOCK_ID}
+    ).scalar()
+    if locked:
+        db.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {MATVIEW}"))
+    db.commit()
+
+
+def _per_course_from_matview(db: Session):
+    return db.execute(text(
+        f"SELECT course_id, title, published, pending, accepted, rejected "
+        f"FROM {MATVIEW} ORDER BY course_id DESC"
+    )).all()
+
+
+def _per_course_aggregate(db: Session):
+    def count(status: str):
+        return func.count(case((Enrollment.status == status, 1)))
+
+    return db.execute(
+        select(
+            Course.id.label("course_id"),
+            Course.title,
+            Course.published,
+            count("pending").label("pending"),
+            count("accepted").label("accepted"),
+            count("rejected").label("rejected"),
+        )
+        .outerjoin(Enrollment, Enrollment.course_id == Course.id)
+        .group_by(Course.id, Course.title, Course.published)
+        .order_by(Course.id.desc())
+    ).all()
+
+
+class AdminCountersCache:
+    """
+    Compteurs du tableau de bord admin, gardés en mémoire. Une tâche asyncio
+    du process (lifespan) les recalcule toutes les
+    ADMIN_COUNTERS_REFRESH_SECONDS secondes, ou plus tôt après une action de
+    modération (vue matérialisée sous PostgreSQL, agrégat GROUP BY sinon).
+    Les lectures ne font que renvoyer l'instantané.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._snapshot: AdminCounters | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    def get(self, db: Session) -> AdminCounters:
+        snapshot = self._snapshot
+        if snapshot is not None and (
+            self._task is not None
+            or time.monotonic() - snapshot.loaded_at < settings.ADMIN_COUNTERS_REFRESH_SECONDS
+        ):
+            return snapshot
+
+        # pas encore d'instantané, ou pas de tâche de fond (scripts, bench) :
+        # lecture seule sur la session de la requête, un seul calcul à la fois
+        if not self._lock.acquire(blocking=False):
+            if snapshot is not None:
+                return snapshot
+            return self._load(db)
+        try:
+            self._snapshot = self._load(db)
+            return self._snapshot
+        finally:
+            self._lock.release()
+
+    def _load(self, db: Session) -> AdminCounters:
+        rows = _per_course_from_matview(db) if _use_matview(db) else _per_course_aggregate(db)
+
+        per_course = tuple(CourseCounters(**r._mapping) for r in rows)
+        return AdminCounters(
+            pending=sum(c.pending for c in per_course),
+            accepted=sum(c.accepted for c in per_course),
+            rejected=sum(c.rejected for c in per_course),
+            courses=len(per_course),
+            users=db.scalar(select(func.count()).select_from(User)),
+            per_course=per_course,
+            refreshed_at=datetime.now(timezone.utc),
+            loaded_at=time.monotonic(),
+        )
+
+    def refresh(self) -> None:
+        """Rafraîchit la vue matérialisée puis l'instantané (thread de fond)."""
+        db = SessionLocal()
+        try:
+            if _use_matview(db):
+                _refresh_matview(db)
+            snapshot = self._load(db)
+            db.rollback()
+        finally:
+            db.close()
+        with self._lock:
+            self._snapshot = snapshot
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="admin-counters")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._loop = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await run_in_threadpool(self.refresh)
+            except Exception:
+                logger.exception("admin counters refresh failed")
+            try:
+                await asyncio.wait_for(self._wake.wait(), settings.ADMIN_COUNTERS_REFRESH_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    def invalidate(self) -> None:
+        """Après une écriture que l'admin doit voir : recalcul en tâche de fond."""
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            # appelé depuis le threadpool : on réveille la tâche dans sa boucle
+            loop.call_soon_threadsafe(self._wake.set)
+        else:
+            self._snapshot = None
+
+
+admin_counters = AdminCountersCache()
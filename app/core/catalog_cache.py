@@ -0,0 +1,130 @@
+import hashlib
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.cache_version import CacheVersion
+from app.models.course import Course
+from app.schemas.course import CourseOut
+
+CATALOG_KEY = "catalog"
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    version: int
+    serial: int  # unique par chargement (clé des caches dérivés)
+    courses: tuple[CourseOut, ...]
+    by_id: dict[int, CourseOut]
+    json_by_id: dict[int, bytes]  # CourseOut déjà sérialisé
+    digest: str  # hash du contenu, identique sur tous les workers (ETag)
+    loaded_at: float
+
+
+def read_shared_version(db: Session) -> int:
+    version = db.execute(
+        select(CacheVersion.version).where(CacheVersion.name == CATALOG_KEY)
+    ).scalar()
+    return version or 0
+
+
+def bump_shared_version(db: Session) -> None:
+    result = db.execute(
+        update(CacheVersion)
+        .where(CacheVersion.name == CATALOG_KEY)
+        .values(version=CacheVersion.version + 1)
+    )
+    if result.rowcount == 0:
+        db.add(CacheVersion(name=CATALOG_KEY, version=1))
+    db.commit()
+
+
+class CatalogCache:
+    """
+    Catalogue des cours publiés gardé en mémoire.
+    Invalidé par les routes d'écriture (admin + API) ; en multi-workers,
+    un compteur en base (cache_versions) est relu au plus toutes les
+    CATALOG_VERSION_CHECK_SECONDS secondes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._snapshot: CatalogSnapshot | None = None
+        self._generation = 0
+        self._checked_at = 0.0
+        self._serials = itertools.count(1)
+
+    def get(self, db: Session) -> CatalogSnapshot:
+        snapshot = self._snapshot
+        now = time.monotonic()
+
+        if snapshot is not None and now - snapshot.loaded_at < settings.CATALOG_CACHE_TTL_SECONDS:
+            if not settings.CATALOG_CACHE_SHARED_VERSION:
+                return snapshot
+            if now - self._checked_at < settings.CATALOG_VERSION_CHECK_SECONDS:
+                return snapshot
+            self._checked_at = now
+            if read_shared_version(db) == snapshot.version:
+                return snapshot
+
+        # un seul rechargement à la fois ; les autres servent l'ancienne version.
+        # Pas d'attente bloquante : le verrou peut être tenu par une greenlet
+        # (AsyncSession.run_sync) sur le même thread.
+        if not self._lock.acquire(blocking=False):
+            if snapshot is not None:
+                return snapshot
+            return self._load(db)
+        try:
+            return self._load(db)
+        finally:
+            self._lock.release()
+
+    def _load(self, db: Session) -> CatalogSnapshot:
+        generation = self._generation
+        if settings.CATALOG_CACHE_SHARED_VERSION:
+            version = read_shared_version(db)
+        else:
+            version = generation
+
+        rows = (
+            db.query(Course)
+            .filter(Course.published == True)  # noqa: E712
+            .order_by(Course.id.desc())
+            .all()
+        )
+        courses = tuple(CourseOut.model_validate(c) for c in rows)
+        json_by_id = {c.id: c.model_dump_json().encode() for c in courses}
+        digest = hashlib.sha1()
+        for c in courses:
+            digest.update(json_by_id[c.id])
+        now = time.monotonic()
+        snapshot = CatalogSnapshot(
+            version=version,
+            serial=next(self._serials),
+            courses=courses,
+            by_id={c.id: c for c in courses},
+            json_by_id=json_by_id,
+            digest=digest.hexdigest(),
+            loaded_at=now,
+        )
+
+        # une invalidation pendant le chargement : on ne garde pas ce résultat
+        if generation == self._generation:
+            self._snapshot = snapshot
+            self._checked_at = now
+        return snapshot
+
+    def invalidate(self, db: Session | None = None) -> None:
+        """À appeler après le commit d'une écriture sur les cours."""
+        self._generation += 1
+        self._snapshot = None
+        if db is not None and settings.CATALOG_CACHE_SHARED_VERSION:
+            bump_shared_version(db)
+
+
+catalog_cache = CatalogCache()
@@ -0,0 +1,152 @@
+import re
+import threading
+import unicodedata
+from collections import defaultdict
+
+from fastapi import HTTPException
+from sqlalchemy import Float, func, literal, literal_column, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.core.catalog_cache import CatalogSnapshot, catalog_cache
+from app.core.config import settings
+from app.models.course import Course
+from app.schemas.course import CourseOut
+
+# poids identiques à setweight() dans la migration : A=1.0, B=0.4, C=0.2
+FIELD_WEIGHTS = {"title": 1.0, "level": 0.4, "description": 0.2}
+
+FRENCH_STOPWORDS = {
+    "a", "au", "aux", "avec", "ce", "ces", "d", "dans", "de", "des", "du", "en",
+    "et", "l", "la", "le", "les", "leur", "mais", "ou", "par", "pas", "pour",
+    "qu", "que", "qui", "sa", "se", "ses", "son", "sur", "un", "une",
+}
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _normalize(text: str) -> str:
+    text = unicodedata.normalize("NFKD", text.lower())
+    return "".join(ch for ch in text if not unicodedata.combining(ch))
+
+
+def _stem(token: str) -> str:
+    # racinisation minimale (pluriels) ; PostgreSQL utilise le stemmer snowball "french"
+    if len(token) > 3 and token[-1] in "sx":
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> list[str]:
+    return [
+        _stem(t)
+        for t in _TOKEN_RE.findall(_normalize(text))
+        if t not in FRENCH_STOPWORDS
+    ]
+
+
+def parse_cursor(cursor: str | None) -> tuple[float, int] | None:
+    if not cursor:
+        return None
+    try:
+        rank, course_id = cursor.split(":", 1)
+        return float(rank), int(course_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def format_cursor(rank: float, course_id: int) -> str:
+    return f"{rank!r}:{course_id}"
+
+
+class CourseSearchIndex:
+    """
+    Index inversé en mémoire sur le catalogue publié (SQLite, tests...).
+    Même sémantique que websearch_to_tsquery : tous les termes doivent être présents.
+    """
+
+    def __init__(self, snapshot: CatalogSnapshot) -> None:
+        self.serial = snapshot.serial
+        self.courses = snapshot.by_id
+        self.postings: dict[str, dict[int, float]] = defaultdict(lambda: defaultdict(float))
+        for course in snapshot.courses:
+            for field, weight in FIELD_WEIGHTS.items():
+                for token in tokenize(getattr(course, field) or ""):
+                    self.postings[token][course.id] += weight
+
+    def search(self, q: str) -> list[tuple[float, int]]:
+        terms = tokenize(q)
+        if not terms:
+            return []
+
+        matches = None
+        for term in terms:
+            ids = set(self.postings.get(term, {}))
+            matches = ids if matches is None else matches & ids
+
+        scored = [
+            (sum(self.postings[t][course_id] for t in terms), course_id)
+            for course_id in matches or ()
+        ]
+        scored.sort(reverse=True)
+        return scored
+
+
+_index_lock = threading.Lock()
+_index: CourseSearchIndex | None = None
+
+
+def _memory_index(db: Session) -> CourseSearchIndex:
+    global _index
+    snapshot = catalog_cache.get(db)
+    index = _index
+    if index is None or index.serial != snapshot.serial:
+        index = CourseSearchIndex(snapshot)
+        with _index_lock:
+            _index = index
+    return index
+
+
+def _use_postgres(db: Session) -> bool:
+    if settings.SEARCH_BACKEND == "memory":
+        return False
+    if settings.SEARCH_BACKEND == "postgres":
+        return True
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def search_courses(db: Session, q: str, limit: int, cursor: str | None = None):
+    """
+    Cours publiés correspondant à q, du plus pertinent au moins pertinent.
+    Pagination par curseur "rang:id". Retourne (cours, curseur suivant).
+    """
+    after = parse_cursor(cursor)
+
+    if _use_postgres(db):
+        query = func.websearch_to_tsquery("french", q)
+        vector = literal_column("courses.search_vector")
+        rank = func.ts_rank_cd(vector, query)
+
+        stmt = (
+            select(Course, rank.label("rank"))
+            .where(Course.published == True, vector.op("@@")(query))  # noqa: E712
+        )
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(rank, Course.id) < tuple_(literal(after[0], Float), after[1])
+            )
+        rows = db.execute(
+            stmt.order_by(rank.desc(), Course.id.desc()).limit(limit + 1)
+        ).all()
+        scored = [(row.rank, CourseOut.model_validate(row.Course)) for row in rows]
+    else:
+        index = _memory_index(db)
+        hits = index.search(q)
+        if after is not None:
+            hits = [h for h in hits if h < after]
+        scored = [(rank, index.courses[course_id]) for rank, course_id in hits[:limit + 1]]
+
+    next_cursor = None
+    if len(scored) > limit:
+        scored = scored[:limit]
+        next_cursor = format_cursor(scored[-1][0], scored[-1][1].id)
+    return [course for _, course in scored], next_cursor
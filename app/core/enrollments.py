@@ -0,0 +1,66 @@
+from fastapi import HTTPException
+from sqlalchemy import literal, select
+from sqlalchemy.orm import Session
+
+from app.core.outbox import enqueue
+from app.db.dialect import dialect_insert
+from app.models.course import Course
+from app.models.enrollment import Enrollment
+
+ENROLLMENT_COLUMNS = (Enrollment.id, Enrollment.user_id, Enrollment.course_id, Enrollment.status)
+
+
+def enrollment_event(e, **extra) -> dict:
+    """Payload outbox d'une inscription (entité ORM ou ligne RETURNING)."""
+    return {
+        "enrollment_id": e.id,
+        "user_id": e.user_id,
+        "course_id": e.course_id,
+        "status": e.status,
+        **extra,
+    }
+
+
+def set_enrollment_status(db: Session, e: Enrollment, status: str, admin_id: int | None = None) -> None:
+    """Modération unitaire : statut + événement outbox, validés ensemble (commit par l'appelant)."""
+    if e.status == status:
+        return
+    e.status = status
+    enqueue(db, "enrollment.status_changed", enrollment_event(e, admin_id=admin_id))
+
+
+def enroll(db: Session, user_id: int, course_id: int):
+    """
+    Inscription idempotente en un aller-retour :
+    INSERT ... SELECT (cours publié) ON CONFLICT DO NOTHING RETURNING.
+    Sans ligne retournée : déjà inscrit (on relit l'inscription) ou cours introuvable.
+    Retourne (inscription, créée ?).
+    """
+    insert = dialect_insert(db.get_bind().dialect.name)
+    stmt = (
+        insert(Enrollment)
+        .from_select(
+            ["user_id", "course_id", "status"],
+            select(literal(user_id), Course.id, literal("pending"))
+            .where(Course.id == course_id, Course.published == True),  # noqa: E712
+        )
+        .on_conflict_do_nothing(index_elements=["user_id", "course_id"])
+        .returning(*ENROLLMENT_COLUMNS)
+    )
+    created = db.execute(stmt).first()
+    if created is not None:
+        # effets de bord (email, audit) : même transaction, traités par le worker
+        enqueue(db, "enrollment.created", enrollment_event(created))
+        db.commit()
+        return created, True
+    # rien d'écrit : pas de commit à attendre
+    db.rollback()
+
+    existing = db.execute(
+        select(*ENROLLMENT_COLUMNS).where(
+            Enrollment.user_id == user_id, Enrollment.course_id == course_id
+        )
+    ).first()
+    if existing is None:
+        raise HTTPException(status_code=404, detail="Course not found")
+    return existing, False
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.config import settings
+from app.core.security import hash_password, verify_password
+
+
+class HashingBusyError(Exception):
+    """File d'attente bcrypt pleine : la requête est refusée (503)."""
+
+
+class HashingPool:
+    """
+    Pool dédié aux appels bcrypt, séparé du threadpool qui sert les pages.
+    Au-delà de max_pending appels en cours ou en attente, on refuse
+    au lieu de ralentir tout le reste du site.
+    """
+
+    def __init__(self, workers: int, max_pending: int) -> None:
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._hash_total = 0.0
+        self._hash_max = 0.0
+
+    async def run(self, fn, *args):
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                raise HashingBusyError()
+            self._pending += 1
+
+        submitted_at = time.perf_counter()
+
+        def task():
+            started_at = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                self._record(started_at - submitted_at, time.perf_counter() - started_at)
+
+        try:
+            future = self._executor.submit(task)
+        except BaseException:
+            self._release()
+            raise
+        # libéré quand le thread a fini (ou si l'appel est annulé avant de démarrer),
+        # pas quand la requête abandonne : bcrypt continue de tourner après une déconnexion
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, future=None) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def _record(self, wait: float, duration: float) -> None:
+        with self._lock:
+            self._completed += 1
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+            self._hash_total += duration
+            self._hash_max = max(self._hash_max, duration)
+
+    def stats(self) -> dict:
+        with self._lock:
+            done = self._completed or 1
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "queue_wait_avg_ms": round(self._wait_total / done * 1000, 2),
+                "queue_wait_max_ms": round(self._wait_max * 1000, 2),
+                "hash_avg_ms": round(self._hash_total / done * 1000, 2),
+                "hash_max_ms": round(self._hash_max * 1000, 2),
+            }
+
+
+hashing_pool = HashingPool(
+    workers=settings.HASH_WORKERS,
+    max_pending=settings.HASH_MAX_PENDING,
+)
+
+
+async def hash_password_async(password: str) -> str:
+    return await hashing_pool.run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await hashing_pool.run(verify_password, plain_password, hashed_password)
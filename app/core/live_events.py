@@ -0,0 +1,213 @@
+import asyncio
+import itertools
+import json
+import logging
+import signal
+import threading
+from dataclasses import dataclass, field
+
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.events")
+
+PG_CHANNEL = "enrollment_events"
+
+# fin de flux (arrêt du serveur)
+CLOSE = object()
+
+
+class TooManyStreamsError(Exception):
+    """Limite de connexions SSE atteinte (503)."""
+
+
+@dataclass(eq=False)
+class Subscription:
+    id: int
+    user_id: int
+    is_admin: bool
+    loop: asyncio.AbstractEventLoop
+    queue: asyncio.Queue = field(repr=False)
+    dropped: int = 0
+
+    def wants(self, event: dict) -> bool:
+        return self.is_admin or event.get("user_id") == self.user_id
+
+
+class EventBroker:
+    """
+    Diffusion en mémoire des changements d'inscription vers les flux SSE
+    du process. publish() peut être appelé depuis n'importe quel thread ;
+    un abonné trop lent perd des événements plutôt que de ralentir les autres.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscriptions: dict[int, Subscription] = {}
+        self._ids = itertools.count(1)
+        self._published = 0
+        self._rejected = 0
+        self._closing = False
+
+    def subscribe(self, user_id: int, is_admin: bool) -> Subscription:
+        with self._lock:
+            per_user = sum(1 for s in self._subscriptions.values() if s.user_id == user_id)
+            if (
+                self._closing
+                or len(self._subscriptions) >= settings.SSE_MAX_CONNECTIONS
+                or per_user >= settings.SSE_MAX_PER_USER
+            ):
+                self._rejected += 1
+                raise TooManyStreamsError()
+            sub = Subscription(
+                id=next(self._ids),
+                user_id=user_id,
+                is_admin=is_admin,
+                loop=asyncio.get_running_loop(),
+                queue=asyncio.Queue(maxsize=settings.SSE_QUEUE_SIZE),
+            )
+            self._subscriptions[sub.id] = sub
+            return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            self._subscriptions.pop(sub.id, None)
+
+    def publish(self, event: dict) -> None:
+        with self._lock:
+            self._published += 1
+            targets = [s for s in self._subscriptions.values() if s.wants(event)]
+        for sub in targets:
+            sub.loop.call_soon_threadsafe(self._deliver, sub, event)
+
+    @staticmethod
+    def _deliver(sub: Subscription, event) -> None:
+        try:
+            sub.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            sub.dropped += 1
+
+    def close_all(self) -> None:
+        """Termine les flux ouverts et refuse les nouveaux (arrêt du worker)."""
+        with self._lock:
+            self._closing = True
+            subs = list(self._subscriptions.values())
+        for sub in subs:
+            sub.loop.call_soon_threadsafe(self._close, sub)
+
+    @staticmethod
+    def _close(sub: Subscription) -> None:
+        # file pleine (client lent) : le marqueur de fin passe avant les événements en attente
+        if sub.queue.full():
+            sub.queue.get_nowait()
+            sub.dropped += 1
+        sub.queue.put_nowait(CLOSE)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "connections": len(self._subscriptions),
+                "published": self._published,
+                "rejected": self._rejected,
+                "dropped": sum(s.dropped for s in self._subscriptions.values()),
+            }
+
+
+broker = EventBroker()
+
+
+def close_streams_on_shutdown_signals() -> None:
+    """
+    uvicorn n'exécute le shutdown du lifespan qu'une fois toutes les
+    connexions terminées : un flux SSE ouvert le bloquerait jusqu'à
+    SSE_MAX_STREAM_SECONDS. On ferme donc les flux dès SIGTERM / SIGINT,
+    puis on laisse le handler de uvicorn (restauré par uvicorn à l'arrêt)
+    déclencher l'arrêt.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        # TestClient : lifespan hors du thread principal, pas de signaux
+        return
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        previous = signal.getsignal(sig)
+        if not callable(previous):
+            continue
+
+        def handler(signum, frame, previous=previous):
+            # pas de verrou dans un handler de signal : close_all passe par la boucle
+            loop.call_soon_threadsafe(broker.close_all)
+            previous(signum, frame)
+
+        signal.signal(sig, handler)
+
+
+def format_sse(event: dict) -> str:
+    return f"event: enrollment\ndata: {json.dumps(event)}\n\n"
+
+
+async def stream(sub: Subscription):
+    """Flux text/event-stream d'un abonné, avec un commentaire « ping » périodique."""
+    deadline = sub.loop.time() + settings.SSE_MAX_STREAM_SECONDS
+    try:
+        # délai de reconnexion conseillé au navigateur (ms)
+        yield "retry: 5000\n\n"
+        while True:
+            timeout = min(settings.SSE_HEARTBEAT_SECONDS, deadline - sub.loop.time())
+            if timeout <= 0:
+                return
+            try:
+                event = await asyncio.wait_for(sub.queue.get(), timeout)
+            except asyncio.TimeoutError:
+                yield ": ping\n\n"
+                continue
+            if event is CLOSE:
+                return
+            yield format_sse(event)
+    finally:
+        broker.unsubscribe(sub)
+
+
+# -------------------------
+# Multi-workers : PostgreSQL LISTEN / NOTIFY (SSE_PG_NOTIFY)
+# -------------------------
+class PgListener:
+    """Relaie les NOTIFY du canal enrollment_events vers le broker du process."""
+
+    def __init__(self) -> None:
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run(), name="pg-listener")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def _run(self) -> None:
+        import psycopg
+
+        conninfo = make_url(settings.DATABASE_URL).set(drivername="postgresql").render_as_string(hide_password=False)
+        delay = 1.0
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(conninfo, autocommit=True) as conn:
+                    await conn.execute(f"LISTEN {PG_CHANNEL}")
+                    delay = 1.0
+                    async for notify in conn.notifies():
+                        broker.publish(json.loads(notify.payload))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("pg listener disconnected, retrying in %.0fs", delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 60)
+
+
+pg_listener = PgListener()
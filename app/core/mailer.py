@@ -0,0 +1,31 @@
+import logging
+import smtplib
+from email.message import EmailMessage
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.mail")
+
+
+def send_email(to: str, subject: str, body: str) -> None:
+    """
+    Envoi SMTP synchrone (appelé par le worker outbox, jamais dans une requête).
+    Sans SMTP_HOST, l'email est seulement journalisé ; en local, un serveur
+    de test suffit : python -m aiosmtpd -n -l localhost:1025, ou MailHog.
+    """
+    message = EmailMessage()
+    message["From"] = settings.SMTP_FROM
+    message["To"] = to
+    message["Subject"] = subject
+    message.set_content(body)
+
+    if not settings.SMTP_HOST:
+        logger.info("email (non envoyé, SMTP_HOST vide) à %s : %s", to, subject)
+        return
+
+    with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT, timeout=10) as smtp:
+        if settings.SMTP_STARTTLS:
+            smtp.starttls()
+        if settings.SMTP_USER:
+            smtp.login(settings.SMTP_USER, settings.SMTP_PASSWORD or "")
+        smtp.send_message(message)
@@ -0,0 +1,72 @@
+from fastapi import HTTPException
+from sqlalchemy import Integer, any_, bindparam, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session
+
+from app.core.admin_counters import admin_counters
+from app.core.enrollments import enrollment_event
+from app.core.outbox import enqueue_many
+from app.models.enrollment import Enrollment
+
+ENROLLMENT_STATUSES = ("pending", "accepted", "rejected")
+
+# au-delà, passer par un filtre (course_id / current_status)
+MAX_BULK_IDS = 5000
+
+
+def check_status(status: str) -> None:
+    if status not in ENROLLMENT_STATUSES:
+        raise HTTPException(status_code=400, detail="Invalid status")
+
+
+def bulk_set_enrollment_status(
+    db: Session,
+    status: str,
+    ids: list[int] | None = None,
+    course_id: int | None = None,
+    current_status: str | None = None,
+    admin_id: int | None = None,
+):
+    """
+    Change le statut de plusieurs inscriptions en un seul UPDATE ... RETURNING
+    (ids explicites et/ou filtre cours + statut actuel), dans une transaction.
+    Retourne les lignes réellement modifiées.
+    """
+    check_status(status)
+    if current_status is not None:
+        check_status(current_status)
+    if not ids and course_id is None and current_status is None:
+        raise HTTPException(status_code=400, detail="No enrollments selected")
+    if ids and len(ids) > MAX_BULK_IDS:
+        raise HTTPException(status_code=400, detail=f"Too many ids (max {MAX_BULK_IDS})")
+
+    # les lignes déjà au bon statut ne sont pas réécrites
+    criteria = [Enrollment.status != status]
+    if ids:
+        if db.get_bind().dialect.name == "postgresql":
+            # id = ANY(:ids) : un seul paramètre tableau, quel que soit le nombre d'ids
+            criteria.append(Enrollment.id == any_(bindparam("ids", list(set(ids)), type_=ARRAY(Integer))))
+        else:
+            criteria.append(Enrollment.id.in_(set(ids)))
+    if course_id is not None:
+        criteria.append(Enrollment.course_id == course_id)
+    if current_status is not None:
+        criteria.append(Enrollment.status == current_status)
+
+    stmt = (
+        update(Enrollment)
+        .where(*criteria)
+        .values(status=status)
+        .returning(Enrollment.id, Enrollment.user_id, Enrollment.course_id, Enrollment.status)
+        .execution_options(synchronize_session=False)
+    )
+    try:
+        rows = db.execute(stmt).all()
+        enqueue_many(db, "enrollment.status_changed", [enrollment_event(r, admin_id=admin_id) for r in rows])
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    if rows:
+        admin_counters.invalidate()
+    return rows
@@ -0,0 +1,96 @@
+import json
+import logging
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.live_events import PG_CHANNEL, broker
+from app.core.mailer import send_email
+from app.core.outbox import handler
+from app.models.course import Course
+from app.models.user import User
+
+audit_logger = logging.getLogger("app.audit")
+
+STATUS_LABELS = {
+    "pending": "en attente",
+    "accepted": "acceptée",
+    "rejected": "refusée",
+}
+
+
+def _student_and_course(db: Session, payload: dict):
+    email = select(User.email).where(User.id == payload["user_id"]).scalar_subquery()
+    title = select(Course.title).where(Course.id == payload["course_id"]).scalar_subquery()
+    row = db.execute(select(email.label("email"), title.label("title"))).first()
+    return row if row.email and row.title else None
+
+
+@handler("enrollment.created")
+def audit_enrollment_created(db: Session, payload: dict) -> None:
+    audit_logger.info(
+        "enrollment %s created: user=%s course=%s",
+        payload["enrollment_id"], payload["user_id"], payload["course_id"],
+    )
+
+
+@handler("enrollment.created")
+def email_enrollment_created(db: Session, payload: dict) -> None:
+    row = _student_and_course(db, payload)
+    if row is None:
+        return
+    send_email(
+        row.email,
+        f"Inscription reçue : {row.title}",
+        f"Bonjour,\n\nTa demande d'inscription au cours « {row.title} » est bien reçue. "
+        "Tu seras prévenu(e) dès qu'elle sera validée.\n\nGhayamathia",
+    )
+
+
+@handler("enrollment.status_changed")
+def audit_enrollment_status(db: Session, payload: dict) -> None:
+    audit_logger.info(
+        "enrollment %s status -> %s (by admin %s)",
+        payload["enrollment_id"], payload["status"], payload.get("admin_id"),
+    )
+
+
+@handler("enrollment.status_changed")
+def email_enrollment_status(db: Session, payload: dict) -> None:
+    if payload["status"] == "pending":
+        return
+    row = _student_and_course(db, payload)
+    if row is None:
+        return
+    label = STATUS_LABELS.get(payload["status"], payload["status"])
+    send_email(
+        row.email,
+        f"Inscription {label} : {row.title}",
+        f"Bonjour,\n\nTon inscription au cours « {row.title} » a été {label}.\n\nGhayamathia",
+    )
+
+
+def _publish_live(db: Session, kind: str, payload: dict) -> None:
+    event = {
+        "kind": kind,
+        "enrollment_id": payload["enrollment_id"],
+        "user_id": payload["user_id"],
+        "course_id": payload["course_id"],
+        "status": payload["status"],
+    }
+    if settings.SSE_PG_NOTIFY and db.get_bind().dialect.name == "postgresql":
+        # envoyé au commit du handler, reçu par le PgListener de chaque worker
+        db.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": PG_CHANNEL, "payload": json.dumps(event)})
+    else:
+        broker.publish(event)
+
+
+@handler("enrollment.created")
+def live_enrollment_created(db: Session, payload: dict) -> None:
+    _publish_live(db, "enrollment.created", payload)
+
+
+@handler("enrollment.status_changed")
+def live_enrollment_status(db: Session, payload: dict) -> None:
+    _publish_live(db, "enrollment.status_changed", payload)
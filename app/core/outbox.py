@@ -0,0 +1,233 @@
+import asyncio
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import event, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.outbox import OutboxEvent
+
+logger = logging.getLogger("app.outbox")
+
+MAX_BACKOFF_SECONDS = 3600
+
+# kind -> fonctions (db, payload) ; exécutées par le worker, hors requête.
+# Livraison « au moins une fois » : chaque handler est marqué livré (colonne
+# delivered) dans la même transaction que ses écritures en base, et n'est
+# plus rejoué ensuite. Un effet externe (email) peut être répété seulement
+# si le process meurt entre l'envoi et ce commit.
+handlers: dict[str, list[Callable[[Session, dict], None]]] = {}
+
+
+def handler(kind: str):
+    def register(fn):
+        handlers.setdefault(kind, []).append(fn)
+        return fn
+    return register
+
+
+def enqueue(db, kind: str, payload: dict) -> None:
+    """
+    Ajoute un événement dans la transaction en cours (Session ou AsyncSession) :
+    il n'existe que si l'écriture métier est validée.
+    """
+    db.add(OutboxEvent(kind=kind, payload=payload))
+    db.info["outbox_pending"] = True
+
+
+def enqueue_many(db, kind: str, payloads: list[dict]) -> None:
+    if payloads:
+        db.add_all([OutboxEvent(kind=kind, payload=p) for p in payloads])
+        db.info["outbox_pending"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_after_commit(session: Session) -> None:
+    if session.info.pop("outbox_pending", False):
+        outbox_worker.wake()
+
+
+def _claim(db: Session, limit: int) -> list[OutboxEvent]:
+    now = datetime.now(timezone.utc)
+    stmt = (
+        select(OutboxEvent)
+        # "processing" dont le bail a expiré : worker mort en cours de traitement
+        .where(OutboxEvent.status.in_(("pending", "processing")), OutboxEvent.available_at <= now)
+        .order_by(OutboxEvent.available_at, OutboxEvent.id)
+        .limit(limit)
+    )
+    if db.get_bind().dialect.name == "postgresql":
+        # plusieurs workers (gunicorn) : chacun prend des lignes différentes
+        stmt = stmt.with_for_update(skip_locked=True)
+    return list(db.scalars(stmt))
+
+
+def _lease() -> datetime:
+    return datetime.now(timezone.utc) + timedelta(seconds=settings.OUTBOX_LEASE_SECONDS)
+
+
+def _backoff(attempts: int) -> timedelta:
+    return timedelta(seconds=min(MAX_BACKOFF_SECONDS, settings.OUTBOX_BACKOFF_SECONDS * 2 ** (attempts - 1)))
+
+
+class OutboxWorker:
+    """
+    Tâche asyncio du process : vide la table outbox_events par lots,
+    réveillée après chaque commit qui a ajouté un événement, sinon toutes
+    les OUTBOX_POLL_SECONDS secondes. Un lot est réservé pour
+    OUTBOX_LEASE_SECONDS puis traité hors transaction de réservation.
+    Un échec est retenté avec un délai exponentiel (handlers restants
+    seulement) ; après OUTBOX_MAX_ATTEMPTS essais l'événement passe en "failed".
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._processed = 0
+        self._retried = 0
+        self._failed = 0
+        self._batches = 0
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="outbox-worker")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._loop = None
+
+    def wake(self) -> None:
+        # appelé depuis n'importe quel thread (commit dans le threadpool)
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._wake.set)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                handled = await run_in_threadpool(self.drain_once)
+            except Exception:
+                logger.exception("outbox worker error")
+                handled = 0
+            # lot complet : il en reste sans doute, on enchaîne
+            if handled >= settings.OUTBOX_BATCH_SIZE:
+                continue
+            try:
+                await asyncio.wait_for(self._wake.wait(), settings.OUTBOX_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    def drain_once(self) -> int:
+        """Traite un lot ; retourne le nombre d'événements pris."""
+        db = SessionLocal()
+        try:
+            claimed = self._claim_batch(db)
+            for item in claimed:
+                self._handle(db, *item)
+            if claimed:
+                with self._lock:
+                    self._batches += 1
+            return len(claimed)
+        finally:
+            db.close()
+
+    def _claim_batch(self, db: Session) -> list[tuple[int, str, dict, list[str], int]]:
+        """
+        Réserve un lot (statut "processing" + bail) et valide tout de suite :
+        les verrous de ligne ne sont pas gardés pendant les handlers.
+        """
+        claimed = []
+        for ev in _claim(db, settings.OUTBOX_BATCH_SIZE):
+            if ev.status == "processing" and ev.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+                ev.status = "failed"
+                ev.last_error = "lease expired"
+                continue
+            ev.attempts += 1
+            ev.status = "processing"
+            ev.available_at = _lease()
+            claimed.append((ev.id, ev.kind, dict(ev.payload), list(ev.delivered or ()), ev.attempts))
+        db.commit()
+        return claimed
+
+    def _update(self, db: Session, event_id: int, attempts: int, **values) -> bool:
+        """
+        Écrit sur l'événement seulement s'il est toujours à nous : après
+        expiration du bail, un autre worker l'a repris (attempts a changé).
+        """
+        result = db.execute(
+            update(OutboxEvent)
+            .where(
+                OutboxEvent.id == event_id,
+                OutboxEvent.status == "processing",
+                OutboxEvent.attempts == attempts,
+            )
+            .values(**values)
+        )
+        return result.rowcount == 1
+
+    def _handle(self, db: Session, event_id: int, kind: str, payload: dict, delivered: list[str], attempts: int) -> None:
+        for fn in handlers.get(kind, ()):
+            if fn.__name__ in delivered:
+                continue
+            try:
+                # bail prolongé avant chaque handler (un envoi SMTP peut être long)
+                if not self._update(db, event_id, attempts, available_at=_lease()):
+                    db.commit()
+                    return
+                db.commit()
+                fn(db, payload)
+                delivered = delivered + [fn.__name__]
+                self._update(db, event_id, attempts, delivered=delivered)
+                db.commit()
+            except Exception as exc:
+                db.rollback()
+                self._fail(db, event_id, kind, attempts, exc)
+                return
+
+        self._update(db, event_id, attempts, status="done", processed_at=datetime.now(timezone.utc))
+        db.commit()
+        with self._lock:
+            self._processed += 1
+
+    def _fail(self, db: Session, event_id: int, kind: str, attempts: int, exc: Exception) -> None:
+        last_error = f"{exc.__class__.__name__}: {exc}"[:2000]
+        if attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+            values = {"status": "failed"}
+            counter = "_failed"
+            logger.error("outbox event %s (%s) failed: %s", event_id, kind, last_error)
+        else:
+            # les handlers déjà livrés ne seront pas rejoués
+            values = {"status": "pending", "available_at": datetime.now(timezone.utc) + _backoff(attempts)}
+            counter = "_retried"
+        self._update(db, event_id, attempts, last_error=last_error, **values)
+        db.commit()
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "running": self._task is not None and not self._task.done(),
+                "batches": self._batches,
+                "processed": self._processed,
+                "retried": self._retried,
+                "failed": self._failed,
+            }
+
+
+outbox_worker = OutboxWorker()
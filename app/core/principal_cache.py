@@ -0,0 +1,131 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from sqlalchemy import event, select, update
+from sqlalchemy.orm import object_session
+
+from app.core.config import settings
+from app.models.cache_version import CacheVersion
+
+PRINCIPALS_KEY = "principals"
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Vue légère (détachée de la session) de l'utilisateur connecté."""
+    id: int
+    email: str
+    role: str
+    is_active: bool
+    token_version: int
+
+    @classmethod
+    def from_user(cls, user) -> "Principal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            role=user.role,
+            is_active=user.is_active,
+            token_version=user.token_version,
+        )
+
+
+class PrincipalCache:
+    """
+    Cache LRU + TTL des utilisateurs authentifiés, indexé par id.
+    Une entrée n'est servie que si la version du token correspond.
+    En multi-workers (AUTH_CACHE_SHARED_VERSION), un compteur en base est relu
+    au plus toutes les AUTH_CACHE_VERSION_CHECK_SECONDS secondes et vide le
+    cache quand un autre worker a révoqué des tokens ; sinon la révocation
+    n'est immédiate que dans le worker qui l'a faite, les autres gardent
+    l'entrée jusqu'à AUTH_CACHE_TTL_SECONDS.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: int) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[int, tuple[Principal, float]] = OrderedDict()
+        self._shared_version: int | None = None
+        self._checked_at = float("-inf")
+
+    def get(self, user_id: int, token_version: int) -> Principal | None:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            principal, expires_at = entry
+            if expires_at < time.monotonic() or principal.token_version != token_version:
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return principal
+
+    def put(self, principal: Principal) -> None:
+        with self._lock:
+            self._entries[principal.id] = (principal, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(principal.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def needs_version_check(self) -> bool:
+        return (
+            settings.AUTH_CACHE_SHARED_VERSION
+            and time.monotonic() - self._checked_at >= settings.AUTH_CACHE_VERSION_CHECK_SECONDS
+        )
+
+    def sync_version(self, version: int) -> None:
+        """Version partagée relue en base : tout est vidé si elle a changé."""
+        with self._lock:
+            self._checked_at = time.monotonic()
+            if version != self._shared_version:
+                self._entries.clear()
+                self._shared_version = version
+
+
+principal_cache = PrincipalCache(
+    max_entries=settings.AUTH_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AUTH_CACHE_TTL_SECONDS,
+)
+
+
+def shared_version_query():
+    return select(CacheVersion.version).where(CacheVersion.name == PRINCIPALS_KEY)
+
+
+def _bump_shared_version(db) -> None:
+    # même transaction que la révocation : visible des autres workers au commit
+    result = db.execute(
+        update(CacheVersion)
+        .where(CacheVersion.name == PRINCIPALS_KEY)
+        .values(version=CacheVersion.version + 1)
+    )
+    if result.rowcount == 0:
+        db.add(CacheVersion(name=PRINCIPALS_KEY, version=1))
+
+
+def revoke_user_tokens(user) -> None:
+    """
+    Invalide les tokens déjà émis pour cet utilisateur (changement de rôle,
+    désactivation, mot de passe...). Le commit reste à la charge de l'appelant.
+    """
+    user.token_version = (user.token_version or 0) + 1
+    principal_cache.invalidate(user.id)
+
+    db = object_session(user)
+    if db is None:
+        return
+    if settings.AUTH_CACHE_SHARED_VERSION:
+        _bump_shared_version(db)
+    # une requête concurrente a pu remettre l'ancien Principal en cache avant le commit
+    event.listen(db, "after_commit", lambda session: principal_cache.invalidate(user.id), once=True)
@@ -0,0 +1,165 @@
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+
+from fastapi import Request
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.rate_limit")
+
+
+class RateLimitExceeded(Exception):
+    """Seau vide : la requête est refusée (429) avant toute requête SQL ou bcrypt."""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(retry_after)
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class Rule:
+    name: str
+    capacity: int  # rafale autorisée
+    per_minute: float  # rechargement
+
+    @property
+    def refill_per_second(self) -> float:
+        return self.per_minute / 60
+
+
+class RateLimitBackend(ABC):
+    """
+    Stockage des seaux. take() consomme un jeton et retourne 0, ou le
+    délai (s) avant le prochain jeton. Une implémentation partagée (Redis...)
+    peut remplacer MemoryBucketStore sans toucher aux appelants.
+    """
+
+    @abstractmethod
+    def take(self, key: str, rule: Rule) -> float:
+        ...
+
+    def stats(self) -> dict:
+        return {}
+
+
+class MemoryBucketStore(RateLimitBackend):
+    """
+    Seaux à jetons en mémoire, un tuple par clé. Un seau inactif depuis
+    assez longtemps pour être plein équivaut à une absence d'entrée : il
+    est supprimé (fenêtre glissante). Au-delà de max_keys, les seaux les
+    plus anciens sont évincés.
+    """
+
+    def __init__(self, max_keys: int) -> None:
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        # clé -> (jetons, mise à jour, instant où le seau sera de nouveau plein)
+        self._buckets: OrderedDict[str, tuple[float, float, float]] = OrderedDict()
+        self._evicted = 0
+
+    def take(self, key: str, rule: Rule) -> float:
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at, _ = self._buckets.pop(key, (rule.capacity, now, now))
+            tokens = min(rule.capacity, tokens + (now - updated_at) * rule.refill_per_second)
+
+            retry_after = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                retry_after = (1 - tokens) / rule.refill_per_second
+
+            full_at = now + (rule.capacity - tokens) / rule.refill_per_second
+            self._buckets[key] = (tokens, now, full_at)
+            self._evict(now)
+            return retry_after
+
+    def _evict(self, now: float) -> None:
+        # ordre = dernière utilisation : on ne regarde que les entrées les plus anciennes
+        while self._buckets:
+            key, (_, _, full_at) = next(iter(self._buckets.items()))
+            if len(self._buckets) <= self.max_keys and full_at > now:
+                break
+            del self._buckets[key]
+            self._evicted += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"keys": len(self._buckets), "evicted": self._evicted}
+
+
+class RateLimiter:
+    def __init__(self, backend: RateLimitBackend) -> None:
+        self.backend = backend
+        self._lock = threading.Lock()
+        self._allowed = 0
+        self._rejected: dict[str, int] = defaultdict(int)
+
+    def check(self, scope: str, rule: Rule, value: str) -> None:
+        retry_after = self.backend.take(f"{scope}:{rule.name}:{value}", rule)
+        with self._lock:
+            if retry_after:
+                self._rejected[f"{scope}_{rule.name}"] += 1
+            else:
+                self._allowed += 1
+        if retry_after:
+            raise RateLimitExceeded(retry_after)
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = {"allowed": self._allowed, "rejected": sum(self._rejected.values())}
+            stats.update({f"rejected_{k}": v for k, v in sorted(self._rejected.items())})
+        stats.update(self.backend.stats())
+        return stats
+
+
+def client_ip(request: Request) -> str:
+    """
+    Derrière un proxy, l'adresse ajoutée par le proxy de confiance le plus
+    proche du client : les entrées à gauche sont fournies par le client
+    lui-même et ne servent pas de clé (sinon un seau neuf par requête).
+    """
+    hops = [h.strip() for h in request.headers.get("x-forwarded-for", "").split(",") if h.strip()]
+    if settings.RATE_LIMIT_TRUST_FORWARDED_FOR:
+        if hops:
+            return hops[-min(len(hops), max(1, settings.RATE_LIMIT_TRUSTED_PROXY_HOPS))]
+    elif hops:
+        _warn_untrusted_proxy(request, hops)
+    return request.client.host if request.client else "unknown"
+
+
+_proxy_warned = False
+
+
+def _warn_untrusted_proxy(request: Request, hops: list[str]) -> None:
+    # uvicorn n'a pas appliqué X-Forwarded-For (pair hors FORWARDED_ALLOW_IPS) :
+    # tous les clients partagent alors le seau de l'adresse du proxy
+    global _proxy_warned
+    peer = request.client.host if request.client else None
+    if _proxy_warned or peer is None or peer in hops:
+        return
+    _proxy_warned = True
+    logger.warning(
+        "rate limit keyed on proxy address %s: X-Forwarded-For is ignored; "
+        "set FORWARDED_ALLOW_IPS or RATE_LIMIT_TRUST_FORWARDED_FOR",
+        peer,
+    )
+
+
+AUTH_IP_RULE = Rule("ip", settings.RATE_LIMIT_AUTH_IP_BURST, settings.RATE_LIMIT_AUTH_IP_PER_MINUTE)
+AUTH_EMAIL_RULE = Rule("email", settings.RATE_LIMIT_AUTH_EMAIL_BURST, settings.RATE_LIMIT_AUTH_EMAIL_PER_MINUTE)
+
+rate_limiter = RateLimiter(MemoryBucketStore(settings.RATE_LIMIT_MAX_KEYS))
+
+
+def limit_auth_attempt(request: Request, scope: str, email: str | None) -> None:
+    """Login / inscription : par IP puis par email, avant la base et bcrypt."""
+    if not settings.RATE_LIMIT_ENABLED:
+        return
+    rate_limiter.check(scope, AUTH_IP_RULE, client_ip(request))
+    if email:
+        rate_limiter.check(scope, AUTH_EMAIL_RULE, email.strip().lower())
@@ -1,23 +1,34 @@
 from datetime import datetime, timedelta, timezone
-from jose import jwt
-from passlib.context import CryptContext
+from functools import lru_cache
 from app.core.config import settings
 
-pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto"
-)
+
+@lru_cache(maxsize=None)
+def get_pwd_context():
+    # passlib / bcrypt chargés au premier hash, pas au démarrage
+    from passlib.context import CryptContext
+
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto"
+    )
 
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 
-def create_access_token(subject: str, role: str) -> str:
+def create_access_token(
+    subject: str,
+    role: str,
+    user_id: int | None = None,
+    is_active: bool = True,
+    token_version: int = 0,
+) -> str:
     expire = datetime.now(timezone.utc) + timedelta(
         minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
     )
@@ -25,11 +36,28 @@ def create_access_token(subject: str, role: str) -> str:
     payload = {
         "sub": subject,
         "role": role,
+        "act": is_active,
+        "tv": token_version,
         "exp": expire
     }
+    if user_id is not None:
+        payload["uid"] = user_id
+
+    # python-jose importe cryptography : chargé au premier token
+    from jose import jwt
 
     return jwt.encode(
         payload,
         settings.JWT_SECRET,
         algorithm=settings.JWT_ALG
     )
+
+
+def create_user_token(user) -> str:
+    return create_access_token(
+        subject=user.email,
+        role=user.role,
+        user_id=user.id,
+        is_active=user.is_active,
+        token_version=user.token_version,
+    )
@@ -0,0 +1,19 @@
+import logging
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger("app.startup")
+
+# durée (ms) de chaque phase de démarrage du worker
+startup_timings: dict[str, float] = {}
+
+
+@contextmanager
+def timed_phase(name: str):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        startup_timings[name] = round(elapsed_ms, 2)
+        logger.info("startup phase %s: %.1f ms", name, elapsed_ms)
@@ -0,0 +1,39 @@
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.db.session import engine_options
+from app.db.instrumentation import instrument_engine
+
+
+def async_database_url() -> str:
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+
+    url = settings.DATABASE_URL
+    if url.startswith("postgresql+psycopg2://") or url.startswith("postgresql://"):
+        # psycopg 3 accepte les mêmes paramètres (sslmode=require...)
+        return "postgresql+psycopg://" + url.split("://", 1)[1]
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url.split("://", 1)[1]
+    return url
+
+
+def async_engine_options() -> dict:
+    # même réglage du pool que le moteur sync, sur sa part du budget de connexions
+    options = engine_options("async")
+    options.pop("poolclass", None)
+    return options
+
+
+async_engine = create_async_engine(
+    async_database_url(),
+    **async_engine_options()
+)
+
+instrument_engine(async_engine.sync_engine)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
@@ -5,3 +5,5 @@ from app.db.base_class import Base  # noqa
 from app.models.user import User  # noqa
 from app.models.course import Course  # noqa
 from app.models.enrollment import Enrollment  # noqa
+from app.models.cache_version import CacheVersion  # noqa
+from app.models.outbox import OutboxEvent  # noqa
@@ -0,0 +1,7 @@
+def dialect_insert(dialect_name: str):
+    """insert() du dialecte : ON CONFLICT (PostgreSQL et SQLite)."""
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
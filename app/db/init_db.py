@@ -1,24 +1,83 @@
+import logging
+
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 from app.models.user import User
-from app.core.config import settings
-from app.core.security import hash_password
+from app.core.config import DEFAULT_ADMIN_PASSWORD, settings
+from app.core.security import get_pwd_context, hash_password
+from app.core.principal_cache import revoke_user_tokens
+
+logger = logging.getLogger("app.bootstrap")
+
+# clé arbitraire pour pg_try_advisory_xact_lock
+ADMIN_BOOTSTRAP_LOCK_ID = 72_410_001
+
+
+def _try_bootstrap_lock(db: Session) -> bool:
+    """
+    Un seul worker fait le bootstrap quand plusieurs démarrent en même temps.
+    Le verrou est relâché au commit / rollback.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return True
+    return bool(
+        db.execute(
+            text("SELECT pg_try_advisory_xact_lock(:key)"),
+            {"key": ADMIN_BOOTSTRAP_LOCK_ID},
+        ).scalar()
+    )
 
 
-def ensure_admin(db: Session) -> None:
+def ensure_admin(db: Session) -> bool:
     """
     Crée ou met à jour le compte admin au démarrage
-    selon les valeurs dans .env
+    selon les valeurs dans .env.
+    Ne réécrit rien si le compte est déjà correct.
+    Retourne True si la base a été modifiée.
     """
+    if settings.ADMIN_PASSWORD == DEFAULT_ADMIN_PASSWORD:
+        logger.error("admin bootstrap skipped: ADMIN_PASSWORD is still the default value")
+        return False
+
+    if not _try_bootstrap_lock(db):
+        # un autre worker s'en occupe
+        db.rollback()
+        return False
+
     admin = db.query(User).filter(
         User.email == settings.ADMIN_EMAIL
     ).first()
 
     if admin:
-        admin.hashed_password = hash_password(settings.ADMIN_PASSWORD)
-        admin.role = "admin"
-        admin.is_active = True
-        db.commit()
-        return
+        changed = False
+
+        revoke = False
+
+        if admin.role != "admin" or not admin.is_active:
+            admin.role = "admin"
+            admin.is_active = True
+            changed = revoke = True
+
+        # une seule vérification bcrypt ; rehash seulement si nécessaire
+        valid, new_hash = get_pwd_context().verify_and_update(
+            settings.ADMIN_PASSWORD, admin.hashed_password
+        )
+        if not valid:
+            # nouveau mot de passe dans le .env : les sessions ouvertes tombent
+            admin.hashed_password = hash_password(settings.ADMIN_PASSWORD)
+            changed = revoke = True
+        elif new_hash:
+            admin.hashed_password = new_hash
+            changed = True
+
+        if revoke:
+            revoke_user_tokens(admin)
+        if changed:
+            db.commit()
+            logger.info("admin account %s updated", settings.ADMIN_EMAIL)
+        else:
+            db.rollback()
+        return changed
 
     admin = User(
         email=settings.ADMIN_EMAIL,
@@ -29,3 +88,5 @@ def ensure_admin(db: Session) -> None:
 
     db.add(admin)
     db.commit()
+    logger.info("admin account %s created", settings.ADMIN_EMAIL)
+    return True
@@ -0,0 +1,90 @@
+import threading
+import time
+
+from sqlalchemy.pool import QueuePool
+
+from app.core.config import settings
+
+
+def connection_budget(kind: str = "sync") -> int | None:
+    """
+    Connexions max du moteur kind ("sync" ou "async") pour ce worker.
+    Le budget DB_MAX_CONNECTIONS du replica est partagé entre les
+    WEB_CONCURRENCY workers puis, avec ASYNC_DB_ENABLED, entre les deux
+    moteurs (ASYNC_DB_POOL_SHARE pour l'async) : ensemble, ils ne le dépassent pas.
+    """
+    if not settings.DB_MAX_CONNECTIONS:
+        return None
+
+    per_worker = max(1, settings.DB_MAX_CONNECTIONS // max(1, settings.WEB_CONCURRENCY))
+    if not settings.ASYNC_DB_ENABLED:
+        return per_worker
+
+    # au moins une connexion chacun (budget de 1 : dépassé d'une connexion)
+    async_part = min(per_worker - 1, round(per_worker * settings.ASYNC_DB_POOL_SHARE))
+    async_part = max(1, async_part)
+    return async_part if kind == "async" else max(1, per_worker - async_part)
+
+
+def pool_sizing(kind: str = "sync") -> tuple[int, int]:
+    """
+    (pool_size, max_overflow) du moteur kind pour ce worker :
+    ~2/3 du budget en connexions permanentes, le reste en overflow.
+    """
+    budget = connection_budget(kind)
+    if budget is None:
+        return settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW
+
+    pool_size = max(1, (budget * 2) // 3)
+    return pool_size, budget - pool_size
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool qui mesure le temps d'attente pour obtenir une connexion."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.failed = 0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except Exception:
+            with self._stats_lock:
+                self.failed += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._stats_lock:
+                self.checkouts += 1
+                self.wait_total += waited
+                self.wait_max = max(self.wait_max, waited)
+
+
+def pool_stats(pool) -> dict:
+    if not isinstance(pool, QueuePool):
+        return {"pool": type(pool).__name__}
+
+    stats = {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "max_overflow": pool._max_overflow,
+    }
+    if isinstance(pool, TimedQueuePool):
+        with pool._stats_lock:
+            checkouts = pool.checkouts or 1
+            stats.update({
+                "checkouts": pool.checkouts,
+                "failed": pool.failed,
+                "wait_avg_ms": round(pool.wait_total / checkouts * 1000, 3),
+                "wait_max_ms": round(pool.wait_max * 1000, 3),
+            })
+    return stats
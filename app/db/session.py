@@ -1,14 +1,77 @@
+import threading
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.core.startup import timed_phase
+from app.db.pool import TimedQueuePool, pool_sizing
+from app.db.instrumentation import instrument_engine
+
+
+def engine_options(kind: str = "sync") -> dict:
+    if settings.DATABASE_URL.startswith("sqlite"):
+        return {}
+
+    pool_size, max_overflow = pool_sizing(kind)
+    return {
+        "poolclass": TimedQueuePool,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        # LIFO : les connexions inactives restent au fond et expirent via recycle
+        "pool_use_lifo": settings.DB_POOL_USE_LIFO,
+    }
+
+
+_engine: Engine | None = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> Engine:
+    """
+    Moteur créé au premier usage plutôt qu'à l'import : le driver
+    (psycopg2...) n'est chargé que lorsqu'une requête touche la base.
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                with timed_phase("engine"):
+                    engine = create_engine(
+                        settings.DATABASE_URL,
+                        **engine_options()
+                    )
+                instrument_engine(engine)
+                _engine = engine
+    return _engine
+
+
+def dispose_engine(close: bool = True) -> None:
+    """Vide le pool s'il existe ; close=False après un fork (connexions du parent)."""
+    if _engine is not None:
+        _engine.dispose(close=close)
+
+
+def __getattr__(name: str):
+    # compatibilité : from app.db.session import engine
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class LazySessionmaker(sessionmaker):
+    """sessionmaker lié au moteur au premier appel."""
+
+    def __call__(self, **local_kw):
+        if self.kw.get("bind") is None:
+            self.configure(bind=get_engine())
+        return super().__call__(**local_kw)
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True
-)
 
-SessionLocal = sessionmaker(
+SessionLocal = LazySessionmaker(
     autocommit=False,
     autoflush=False,
-    bind=engine
 )
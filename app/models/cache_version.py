@@ -0,0 +1,19 @@
+from sqlalchemy import String, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base_class import Base
+
+
+
+class CacheVersion(Base):
+    __tablename__ = "cache_versions"
+
+    name: Mapped[str] = mapped_column(
+        String(50),
+        primary_key=True
+    )  # catalog / ...
+
+    version: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False
+    )
@@ -1,17 +1,47 @@
-from sqlalchemy import String, Text, Boolean, Integer
-from sqlalchemy.orm import Mapped, mapped_column
+from typing import TYPE_CHECKING
+
+from sqlalchemy import String, Text, Boolean, Integer, Index, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base_class import Base
 
+if TYPE_CHECKING:
+    from app.models.enrollment import Enrollment
+
 
 
 class Course(Base):
     __tablename__ = "courses"
+    __table_args__ = (
+        # catalogue public : WHERE published ORDER BY id DESC
+        Index(
+            "ix_courses_published_id",
+            text("id DESC"),
+            postgresql_where=text("published"),
+            sqlite_where=text("published = 1"),
+        ),
+        # filtres ?level=...&min_price=...&max_price=...
+        Index("ix_courses_level_price", "level", "price_eur"),
+        # filtres de durée / prix sans niveau
+        Index(
+            "ix_courses_published_duration",
+            "duration_minutes",
+            postgresql_where=text("published"),
+            sqlite_where=text("published = 1"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(
         primary_key=True,
         autoincrement=True
     )
 
+    # identifiant stable pour l'import en masse (upsert) ; facultatif
+    code: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+        unique=True
+    )
+
     title: Mapped[str] = mapped_column(
         String(200),
         nullable=False,
@@ -45,3 +75,9 @@ class Course(Base):
         default=True,
         nullable=False
     )
+
+    # la base refuse la suppression tant que des inscriptions existent
+    enrollments: Mapped[list["Enrollment"]] = relationship(
+        back_populates="course",
+        passive_deletes=True
+    )
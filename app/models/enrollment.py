@@ -1,4 +1,5 @@
 from sqlalchemy import Column, Integer, ForeignKey, String, DateTime, func, UniqueConstraint
+from sqlalchemy.orm import relationship
 from app.db.base_class import Base
 
 
@@ -11,4 +12,7 @@ class Enrollment(Base):
     status = Column(String, nullable=False, default="pending")  # pending/accepted/rejected
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
+    user = relationship("User", back_populates="enrollments")
+    course = relationship("Course", back_populates="enrollments")
+
     __table_args__ = (UniqueConstraint("user_id", "course_id", name="uq_enrollment_user_course"),)
@@ -0,0 +1,76 @@
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, Index, Integer, String, Text, func, text
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base_class import Base
+
+
+
+class OutboxEvent(Base):
+    __tablename__ = "outbox_events"
+    __table_args__ = (
+        # file d'attente du worker : événements à traiter (ou bail expiré), par date de disponibilité
+        Index(
+            "ix_outbox_events_pending",
+            "available_at",
+            postgresql_where=text("status IN ('pending', 'processing')"),
+            sqlite_where=text("status IN ('pending', 'processing')"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(
+        primary_key=True,
+        autoincrement=True
+    )
+
+    kind: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False
+    )  # enrollment.created / enrollment.status_changed / ...
+
+    payload: Mapped[dict] = mapped_column(
+        JSON,
+        nullable=False
+    )
+
+    status: Mapped[str] = mapped_column(
+        String(20),
+        default="pending",
+        nullable=False
+    )  # pending / processing / done / failed
+
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False
+    )
+
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+
+    processed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True
+    )
+
+    # noms des handlers déjà exécutés : jamais rejoués lors d'un nouvel essai
+    delivered: Mapped[list] = mapped_column(
+        JSON,
+        default=list,
+        server_default=text("'[]'"),
+        nullable=False
+    )
+
+    last_error: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True
+    )
@@ -1,7 +1,12 @@
-from sqlalchemy import String, Boolean
-from sqlalchemy.orm import Mapped, mapped_column
+from typing import TYPE_CHECKING
+
+from sqlalchemy import String, Boolean, Integer
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base_class import Base
 
+if TYPE_CHECKING:
+    from app.models.enrollment import Enrollment
+
 
 
 class User(Base):
@@ -35,3 +40,16 @@ class User(Base):
         default=True,
         nullable=False
     )
+
+    token_version: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False
+    )  # incrémenté pour révoquer les tokens existants
+
+    # la base refuse la suppression tant que des inscriptions existent
+    enrollments: Mapped[list["Enrollment"]] = relationship(
+        back_populates="user",
+        passive_deletes=True
+    )
@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class CourseCountersOut(BaseModel):
+    course_id: int
+    title: str
+    published: bool
+    pending: int
+    accepted: int
+    rejected: int
+
+    class Config:
+        from_attributes = True
+
+
+class AdminCountersOut(BaseModel):
+    pending: int
+    accepted: int
+    rejected: int
+    courses: int
+    users: int
+    per_course: list[CourseCountersOut]
+    refreshed_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -1,7 +1,8 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class CourseCreate(BaseModel):
+    code: str | None = Field(None, max_length=64)
     title: str
     description: str
     level: str
@@ -11,6 +12,7 @@ class CourseCreate(BaseModel):
 
 
 class CourseUpdate(BaseModel):
+    code: str | None = Field(None, max_length=64)
     title: str | None = None
     description: str | None = None
     level: str | None = None
@@ -21,6 +23,7 @@ class CourseUpdate(BaseModel):
 
 class CourseOut(BaseModel):
     id: int
+    code: str | None = None
     title: str
     description: str
     level: str
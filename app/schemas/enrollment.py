@@ -14,3 +14,14 @@ class EnrollmentOut(BaseModel):
 
     class Config:
         from_attributes = True
+
+class EnrollmentBulkUpdate(BaseModel):
+    status: str
+    ids: list[int] | None = None
+    # ou : toutes les inscriptions d'un cours / d'un statut ("pending" du cours X)
+    course_id: int | None = None
+    current_status: str | None = None
+
+class EnrollmentBulkResult(BaseModel):
+    updated: int
+    enrollments: list[EnrollmentOut]
@@ -0,0 +1,156 @@
+import zlib
+
+import brotli
+
+from app.core.config import settings
+
+COMPRESSIBLE_TYPES = (
+    "text/html",
+    "text/css",
+    "text/csv",
+    "text/plain",
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "image/svg+xml",
+)
+
+
+class _Gzip:
+    encoding = "gzip"
+
+    def __init__(self) -> None:
+        self._obj = zlib.compressobj(settings.GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+
+class _Brotli:
+    encoding = "br"
+
+    def __init__(self) -> None:
+        self._obj = brotli.Compressor(quality=settings.BROTLI_QUALITY)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.process(data)
+
+    def flush(self) -> bytes:
+        return self._obj.finish()
+
+
+def _pick_encoder(accept_encoding: str):
+    accepted = set()
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if q > 0:
+            accepted.add(name.strip().lower())
+
+    if "br" in accepted:
+        return _Brotli
+    if "gzip" in accepted:
+        return _Gzip
+    return None
+
+
+class CompressionMiddleware:
+    """
+    Compression brotli / gzip des réponses texte au-delà de COMPRESSION_MIN_SIZE
+    octets. Les réponses en flux (exports) sont compressées au fil de l'eau ;
+    text/event-stream n'est pas dans COMPRESSIBLE_TYPES et part tel quel.
+    """
+
+    def __init__(self, app, minimum_size: int) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        headers = dict(scope.get("headers", []))
+        encoder_cls = _pick_encoder(headers.get(b"accept-encoding", b"").decode("latin-1"))
+        if encoder_cls is None:
+            return await self.app(scope, receive, send)
+
+        start_message = None
+        encoder = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, encoder, passthrough
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                response_headers = {k.lower(): v for k, v in message.get("headers", [])}
+                content_type = response_headers.get(b"content-type", b"").decode("latin-1")
+                passthrough = (
+                    b"content-encoding" in response_headers
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                    # 206 : plage d'octets de la représentation non compressée
+                    or message["status"] in (204, 206, 304)
+                )
+                if passthrough:
+                    await send(message)
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if encoder is None:
+                if not more_body and len(body) < self.minimum_size:
+                    # trop petit : pas de compression
+                    await send(start_message)
+                    await send(message)
+                    passthrough = True
+                    return
+
+                encoder = encoder_cls()
+                new_headers = []
+                vary = []
+                for k, v in start_message.get("headers", []):
+                    name = k.lower()
+                    if name == b"content-length":
+                        continue
+                    if name == b"vary":
+                        vary.extend(t.strip() for t in v.split(b",") if t.strip())
+                        continue
+                    if name == b"etag" and not v.startswith(b"W/"):
+                        # le corps change selon l'encodage : ETag faible
+                        v = b"W/" + v
+                    new_headers.append((k, v))
+                new_headers.append((b"content-encoding", encoder.encoding.encode()))
+                # fusion avec un Vary existant (Cookie, Origin...)
+                if not any(t.lower() in (b"accept-encoding", b"*") for t in vary):
+                    vary.append(b"Accept-Encoding")
+                new_headers.append((b"vary", b", ".join(vary)))
+
+                if not more_body:
+                    compressed = encoder.compress(body) + encoder.flush()
+                    new_headers.append((b"content-length", str(len(compressed)).encode()))
+                    await send({**start_message, "headers": new_headers})
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+
+                await send({**start_message, "headers": new_headers})
+
+            chunk = encoder.compress(body)
+            if not more_body:
+                chunk += encoder.flush()
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,139 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from app.core.config import settings
+from app.db.instrumentation import RequestDbStats, current_db_stats
+
+logger = logging.getLogger("app.perf")
+
+
+class MetricsRegistry:
+    """Compteurs par route (gabarit de chemin, pas l'URL brute) au format Prometheus."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests: dict[tuple[str, str, int], int] = defaultdict(int)
+        self.duration: dict[tuple[str, str], list[float]] = defaultdict(lambda: [0.0, 0])
+        self.db_queries: dict[tuple[str, str], int] = defaultdict(int)
+        self.db_seconds: dict[tuple[str, str], float] = defaultdict(float)
+        self.slow_requests: dict[tuple[str, str], int] = defaultdict(int)
+
+    def record(self, method: str, route: str, status: int, seconds: float, db: RequestDbStats, slow: bool) -> None:
+        key = (method, route)
+        with self._lock:
+            self.requests[(method, route, status)] += 1
+            self.duration[key][0] += seconds
+            self.duration[key][1] += 1
+            self.db_queries[key] += db.queries
+            self.db_seconds[key] += db.total_seconds
+            if slow:
+                self.slow_requests[key] += 1
+
+    def render(self, gauges: dict[str, float] | None = None) -> str:
+        lines = []
+
+        def family(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        with self._lock:
+            family("http_requests_total", "counter", "Requêtes HTTP traitées.")
+            for (method, route, status), value in sorted(self.requests.items()):
+                lines.append(f'http_requests_total{{method="{method}",route="{route}",status="{status}"}} {value}')
+
+            family("http_request_duration_seconds", "summary", "Durée des requêtes HTTP.")
+            for (method, route), (total, count) in sorted(self.duration.items()):
+                labels = f'method="{method}",route="{route}"'
+                lines.append(f"http_request_duration_seconds_sum{{{labels}}} {total:.6f}")
+                lines.append(f"http_request_duration_seconds_count{{{labels}}} {count}")
+
+            family("db_queries_total", "counter", "Requêtes SQL émises.")
+            for (method, route), value in sorted(self.db_queries.items()):
+                lines.append(f'db_queries_total{{method="{method}",route="{route}"}} {value}')
+
+            family("db_query_duration_seconds_total", "counter", "Temps passé en base.")
+            for (method, route), value in sorted(self.db_seconds.items()):
+                lines.append(f'db_query_duration_seconds_total{{method="{method}",route="{route}"}} {value:.6f}')
+
+            family("http_slow_requests_total", "counter", "Requêtes au-delà des seuils SLOW_*.")
+            for (method, route), value in sorted(self.slow_requests.items()):
+                lines.append(f'http_slow_requests_total{{method="{method}",route="{route}"}} {value}')
+
+        for name, value in sorted((gauges or {}).items()):
+            family(name, "gauge", name.replace("_", " ") + ".")
+            lines.append(f"{name} {value}")
+
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
+
+
+def _route_template(scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Pour chaque requête : nombre de requêtes SQL, temps en base, requête la
+    plus lente. Renvoyés dans Server-Timing, agrégés pour /metrics et
+    journalisés au-delà des seuils SLOW_*.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        stats = RequestDbStats()
+        token = current_db_stats.set(stats)
+        started = time.perf_counter()
+        status = 500
+        streaming = False
+
+        async def send_with_timing(message):
+            nonlocal status, streaming
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                # flux SSE : connexion longue par nature, pas une requête lente
+                streaming = any(
+                    k.lower() == b"content-type" and v.startswith(b"text/event-stream")
+                    for k, v in message.get("headers", [])
+                )
+                app_ms = (time.perf_counter() - started) * 1000
+                timing = (
+                    f'db;dur={stats.total_seconds * 1000:.2f};desc="{stats.queries} queries", '
+                    f"app;dur={app_ms:.2f}"
+                )
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", timing.encode("latin-1"))
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_db_stats.reset(token)
+            elapsed = time.perf_counter() - started
+            route = _route_template(scope)
+            slow = not streaming and (
+                elapsed * 1000 > settings.SLOW_REQUEST_MS
+                or stats.queries > settings.SLOW_REQUEST_QUERIES
+            )
+            metrics_registry.record(scope["method"], route, status, elapsed, stats, slow)
+
+            if slow:
+                logger.warning(
+                    "slow request %s %s: %.1f ms, %d queries, %.1f ms in db",
+                    scope["method"], route, elapsed * 1000, stats.queries, stats.total_seconds * 1000,
+                )
+            if stats.slowest_seconds * 1000 > settings.SLOW_QUERY_MS:
+                logger.warning(
+                    "slow query on %s %s (%.1f ms): %s",
+                    scope["method"], route, stats.slowest_seconds * 1000, stats.slowest_statement,
+                )
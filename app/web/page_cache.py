@@ -0,0 +1,85 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable
+
+from fastapi import Request
+from fastapi.responses import HTMLResponse, Response
+
+from app.web.conditional import cache_headers, is_not_modified, make_etag, not_modified_response
+
+# les pages publiques dépendent du catalogue : le client revalide à chaque fois
+# (réponse 304 si rien n'a changé)
+PUBLIC_PAGE_CACHE_CONTROL = "public, no-cache"
+PRIVATE_PAGE_CACHE_CONTROL = "private, no-cache"
+
+
+@dataclass(frozen=True)
+class RenderedPage:
+    body: bytes
+    etag: str
+    last_modified: float | None
+
+
+class PageCache:
+    """
+    HTML déjà rendu pour un chargement du catalogue (CatalogSnapshot.serial).
+    Un nouveau chargement vide le cache : le catalogue a pu changer.
+    """
+
+    def __init__(self, max_entries: int = 512) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._version = None
+        self._entries: OrderedDict[tuple, RenderedPage] = OrderedDict()
+
+    def get_or_render(self, version, key: tuple, render: Callable[[], str]) -> RenderedPage:
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+            page = self._entries.get(key)
+            if page is not None:
+                self._entries.move_to_end(key)
+                return page
+
+        page = render_page(render())
+
+        with self._lock:
+            if version == self._version:
+                self._entries[key] = page
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return page
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+
+
+def render_page(html: str) -> RenderedPage:
+    body = html.encode("utf-8")
+    return RenderedPage(body=body, etag=make_etag(body), last_modified=time.time())
+
+
+def with_fragment(shell: RenderedPage, marker: str, fragment: str, per_user: bool) -> RenderedPage:
+    """Insère un fragment rendu par requête dans une page en cache."""
+    data = fragment.encode("utf-8")
+    return RenderedPage(
+        body=shell.body.replace(marker.encode("utf-8"), data, 1),
+        etag=make_etag(shell.etag.encode("ascii") + data),
+        # le fragment peut changer sans que la page change : pas de Last-Modified
+        last_modified=None if per_user else shell.last_modified,
+    )
+
+
+def page_response(request: Request, page: RenderedPage, cache_control: str = PUBLIC_PAGE_CACHE_CONTROL) -> Response:
+    headers = cache_headers(page.etag, cache_control, page.last_modified)
+    if is_not_modified(request, page.etag, page.last_modified):
+        return not_modified_response(headers)
+    return HTMLResponse(content=page.body, headers=headers)
+
+
+page_cache = PageCache()
@@ -0,0 +1,429 @@
+"""Pages HTML du site (Jinja2) : public, authentification, espace élève, back-office."""
+import math
+
+from fastapi import APIRouter, Request, Depends, HTTPException, Form
+from fastapi.responses import RedirectResponse
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from app.core.catalog_cache import catalog_cache
+from app.core.admin_counters import admin_counters
+from app.api.deps import get_db, get_current_user, require_admin
+from app.api.pagination import keyset_page
+from app.api.filters import CourseFilters
+from app.models.course import Course
+from app.models.enrollment import Enrollment
+from app.models.user import User
+from app.core.principal_cache import Principal
+from app.content.projects import PROJECTS
+from app.core.security import create_user_token
+from app.core.enrollments import enroll, set_enrollment_status
+from app.core.moderation import bulk_set_enrollment_status
+from app.core.hashing import hash_password_async, verify_password_async
+from app.core.rate_limit import RateLimitExceeded, limit_auth_attempt
+from app.web.utils import set_auth_cookie, clear_auth_cookie
+from app.web.templates import templates
+from app.web.page_cache import (
+    page_cache,
+    page_response,
+    with_fragment,
+    PRIVATE_PAGE_CACHE_CONTROL,
+)
+
+router = APIRouter()
+
+# taille des pages HTML paginées (/me, /admin/...)
+PAGE_SIZE = 50
+
+def too_many_attempts_page(request: Request, template: str, exc: RateLimitExceeded):
+    return templates.TemplateResponse(
+        template,
+        {"request": request, "error": f"Trop de tentatives. Réessaie dans {math.ceil(exc.retry_after)} s."},
+        status_code=429,
+        headers={"Retry-After": str(math.ceil(exc.retry_after))},
+    )
+
+# -------------------------
+# SITE PUBLIC
+# -------------------------
+COURSE_ACTIONS_MARKER = "<!--course-actions-->"
+
+def render_template(name: str, **context) -> str:
+    return templates.get_template(name).render(**context)
+
+@router.get("/")
+def home(request: Request, db: Session = Depends(get_db)):
+    catalog = catalog_cache.get(db)
+    page = page_cache.get_or_render(
+        catalog.serial,
+        ("home",),
+        lambda: render_template(
+            "home.html",
+            page_title="Ghayamathia — Ghaya Bedoui",
+            courses=catalog.courses,
+            projects=PROJECTS,
+            published_count=len(catalog.courses),
+        ),
+    )
+    return page_response(request, page)
+
+@router.get("/courses")
+def courses_page(
+    request: Request,
+    filters: CourseFilters = Depends(),
+    db: Session = Depends(get_db),
+):
+    catalog = catalog_cache.get(db)
+    page = page_cache.get_or_render(
+        catalog.serial,
+        ("courses", filters.key()),
+        lambda: render_template(
+            "courses_list.html",
+            courses=filters.apply(catalog.courses),
+            filters=filters,
+            levels=sorted({c.level for c in catalog.courses}),
+        ),
+    )
+    return page_response(request, page)
+
+@router.get("/courses/{course_id}")
+def course_detail_page(course_id: int, request: Request, db: Session = Depends(get_db)):
+    catalog = catalog_cache.get(db)
+    course = catalog.by_id.get(course_id)
+    if not course:
+        raise HTTPException(status_code=404, detail="Course not found")
+
+    # utilisateur connecté ? (on ne force pas login ici)
+    user = None
+    try:
+        user = get_current_user(request, db)  # type: ignore
+    except Exception:
+        user = None
+
+    already_enrolled = False
+    if user:
+        already_enrolled = (
+            db.query(Enrollment.id)
+            .filter(Enrollment.user_id == user.id, Enrollment.course_id == course_id)
+            .first()
+            is not None
+        )
+
+    # la fiche du cours est en cache ; seul le bloc "inscription" dépend de l'utilisateur
+    shell = page_cache.get_or_render(
+        catalog.serial,
+        ("course_detail", course_id),
+        lambda: render_template("course_detail.html", course=course, actions_html=COURSE_ACTIONS_MARKER),
+    )
+    actions = render_template(
+        "course_detail_actions.html",
+        course=course,
+        user=user,
+        already_enrolled=already_enrolled,
+    )
+    page = with_fragment(shell, COURSE_ACTIONS_MARKER, actions, per_user=user is not None)
+    if user:
+        return page_response(request, page, PRIVATE_PAGE_CACHE_CONTROL)
+    return page_response(request, page)
+
+# -------------------------
+# AUTH WEB (PAGES)
+# -------------------------
+@router.get("/login")
+def login_page(request: Request):
+    return templates.TemplateResponse("auth_login.html", {"request": request})
+
+@router.post("/login")
+async def login_action(
+    request: Request,
+    email: str = Form(...),
+    password: str = Form(...),
+    db: Session = Depends(get_db),
+):
+    try:
+        limit_auth_attempt(request, "login", email)
+    except RateLimitExceeded as exc:
+        return too_many_attempts_page(request, "auth_login.html", exc)
+
+    user = await run_in_threadpool(lambda: db.query(User).filter(User.email == email).first())
+    if not user or not user.is_active or not await verify_password_async(password, user.hashed_password):
+        return templates.TemplateResponse(
+            "auth_login.html",
+            {"request": request, "error": "Email ou mot de passe incorrect."},
+            status_code=401,
+        )
+
+    token = create_user_token(user)
+    response = RedirectResponse(url="/me", status_code=303)
+    set_auth_cookie(response, token)
+    return response
+
+@router.get("/register")
+def register_page(request: Request):
+    return templates.TemplateResponse("auth_register.html", {"request": request})
+
+@router.post("/register")
+async def register_action(
+    request: Request,
+    email: str = Form(...),
+    password: str = Form(...),
+    db: Session = Depends(get_db),
+):
+    try:
+        limit_auth_attempt(request, "register", email)
+    except RateLimitExceeded as exc:
+        return too_many_attempts_page(request, "auth_register.html", exc)
+
+    exists = await run_in_threadpool(lambda: db.query(User).filter(User.email == email).first())
+    if exists:
+        return templates.TemplateResponse(
+            "auth_register.html",
+            {"request": request, "error": "Cet email est déjà utilisé."},
+            status_code=409,
+        )
+
+    user = User(
+        email=email,
+        hashed_password=await hash_password_async(password),
+        role="user",
+        is_active=True,
+    )
+
+    def save():
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+
+    await run_in_threadpool(save)
+
+    token = create_user_token(user)
+    response = RedirectResponse(url="/me", status_code=303)
+    set_auth_cookie(response, token)
+    return response
+
+@router.get("/logout")
+def logout():
+    response = RedirectResponse(url="/", status_code=303)
+    clear_auth_cookie(response)
+    return response
+
+# -------------------------
+# ESPACE ELEVE
+# -------------------------
+@router.get("/me")
+def me_dashboard(
+    request: Request,
+    cursor: int | None = None,
+    user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    # une seule requête : inscriptions + cours liés
+    query = (
+        db.query(
+            Enrollment.id,
+            Enrollment.status,
+            Enrollment.course_id,
+            Course.title.label("course_title"),
+            Course.description.label("course_description"),
+        )
+        .join(Enrollment.course)
+        .filter(Enrollment.user_id == user.id)
+    )
+    my_enrollments, next_cursor = keyset_page(query, Enrollment.id, cursor, PAGE_SIZE)
+
+    return templates.TemplateResponse(
+        "me_dashboard.html",
+        {
+            "request": request,
+            "user": user,
+            "enrollments": my_enrollments,
+            "cursor": cursor,
+            "next_cursor": next_cursor,
+        },
+    )
+
+@router.post("/courses/{course_id}/enroll")
+def enroll_from_site(
+    course_id: int,
+    request: Request,
+    user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    _, created = enroll(db, user.id, course_id)
+    if not created:
+        return RedirectResponse(url=f"/courses/{course_id}", status_code=303)
+
+    return RedirectResponse(url="/me", status_code=303)
+
+# -------------------------
+# ADMIN BACK-OFFICE
+# -------------------------
+@router.get("/admin")
+def admin_dashboard(request: Request, admin: Principal = Depends(require_admin), db: Session = Depends(get_db)):
+    # compteurs en mémoire (recalculés périodiquement), pas de COUNT(*) par affichage
+    stats = admin_counters.get(db)
+    return templates.TemplateResponse(
+        "admin_dashboard.html",
+        {
+            "request": request,
+            "admin": admin,
+            "pending_count": stats.pending,
+            "courses_count": stats.courses,
+            "users_count": stats.users,
+            "stats": stats,
+        },
+    )
+
+@router.get("/admin/courses")
+def admin_courses(
+    request: Request,
+    cursor: int | None = None,
+    admin: Principal = Depends(require_admin),
+    db: Session = Depends(get_db),
+):
+    query = db.query(Course.id, Course.title, Course.description, Course.published)
+    page, next_cursor = keyset_page(query, Course.id, cursor, PAGE_SIZE)
+    return templates.TemplateResponse(
+        "admin_courses.html",
+        {"request": request, "admin": admin, "courses": page, "cursor": cursor, "next_cursor": next_cursor},
+    )
+
+@router.get("/admin/courses/new")
+def admin_course_new(request: Request, admin: Principal = Depends(require_admin)):
+    return templates.TemplateResponse(
+        "admin_course_form.html",
+        {"request": request, "admin": admin, "mode": "create", "course": None},
+    )
+
+@router.post("/admin/courses/new")
+def admin_course_create(
+    request: Request,
+    admin: Principal = Depends(require_admin),
+    db: Session = Depends(get_db),
+    title: str = Form(...),
+    description: str = Form(""),
+    level: str = Form(""),
+    duration_minutes: int = Form(...),
+    price_eur: int = Form(...),
+    published: str = Form("false"),
+):
+    c = Course(
+        title=title,
+        description=description,
+        level=level,
+        duration_minutes=duration_minutes,
+        price_eur=price_eur,
+        published=(published == "true"),
+    )
+    db.add(c)
+    db.commit()
+    catalog_cache.invalidate(db)
+    return RedirectResponse(url="/admin/courses", status_code=303)
+
+@router.get("/admin/courses/{course_id}/edit")
+def admin_course_edit(course_id: int, request: Request, admin: Principal = Depends(require_admin), db: Session = Depends(get_db)):
+    course = db.query(Course).filter(Course.id == course_id).first()
+    if not course:
+        raise HTTPException(status_code=404, detail="Course not found")
+    return templates.TemplateResponse(
+        "admin_course_form.html",
+        {"request": request, "admin": admin, "mode": "edit", "course": course},
+    )
+
+@router.post("/admin/courses/{course_id}/edit")
+def admin_course_update(
+    course_id: int,
+    request: Request,
+    admin: Principal = Depends(require_admin),
+    db: Session = Depends(get_db),
+    title: str = Form(...),
+    description: str = Form(""),
+    level: str = Form(""),
+    duration_minutes: int = Form(...),
+    price_eur: int = Form(...),
+    published: str = Form("false"),
+):
+    course = db.query(Course).filter(Course.id == course_id).first()
+    if not course:
+        raise HTTPException(status_code=404, detail="Course not found")
+
+    course.title = title
+    course.description = description
+    course.level = level
+    course.duration_minutes = duration_minutes
+    course.price_eur = price_eur
+    course.published = (published == "true")
+    db.commit()
+    catalog_cache.invalidate(db)
+    return RedirectResponse(url="/admin/courses", status_code=303)
+
+@router.post("/admin/courses/{course_id}/delete")
+def admin_course_delete(course_id: int, admin: Principal = Depends(require_admin), db: Session = Depends(get_db)):
+    course = db.query(Course).filter(Course.id == course_id).first()
+    if not course:
+        raise HTTPException(status_code=404, detail="Course not found")
+    db.delete(course)
+    db.commit()
+    catalog_cache.invalidate(db)
+    return RedirectResponse(url="/admin/courses", status_code=303)
+
+@router.get("/admin/enrollments")
+def admin_enrollments(
+    request: Request,
+    cursor: int | None = None,
+    admin: Principal = Depends(require_admin),
+    db: Session = Depends(get_db),
+):
+    # une seule requête : inscriptions + email élève + titre du cours
+    query = (
+        db.query(
+            Enrollment.id,
+            Enrollment.status,
+            User.email.label("user_email"),
+            Course.title.label("course_title"),
+        )
+        .join(Enrollment.user)
+        .join(Enrollment.course)
+    )
+    ens, next_cursor = keyset_page(query, Enrollment.id, cursor, PAGE_SIZE)
+
+    return templates.TemplateResponse(
+        "admin_enrollments.html",
+        {
+            "request": request,
+            "admin": admin,
+            "enrollments": ens,
+            "cursor": cursor,
+            "next_cursor": next_cursor,
+        },
+    )
+
+@router.post("/admin/enrollments/bulk")
+def admin_bulk_set_enrollments(
+    ids: list[int] = Form([]),
+    status_value: str = Form(...),
+    admin: Principal = Depends(require_admin),
+    db: Session = Depends(get_db),
+):
+    # cases cochées sur la page : un seul UPDATE pour toute la sélection
+    if ids:
+        bulk_set_enrollment_status(db, status_value, ids, admin_id=admin.id)
+    return RedirectResponse(url="/admin/enrollments", status_code=303)
+
+@router.post("/admin/enrollments/{enrollment_id}/set")
+def admin_set_enrollment(
+    enrollment_id: int,
+    status_value: str = Form(...),  # accepted/rejected/pending
+    admin: Principal = Depends(require_admin),
+    db: Session = Depends(get_db),
+):
+    e = db.query(Enrollment).filter(Enrollment.id == enrollment_id).first()
+    if not e:
+        raise HTTPException(status_code=404, detail="Enrollment not found")
+    if status_value not in ("pending", "accepted", "rejected"):
+        raise HTTPException(status_code=400, detail="Invalid status")
+    set_enrollment_status(db, e, status_value, admin.id)
+    db.commit()
+    admin_counters.invalidate()
+    return RedirectResponse(url="/admin/enrollments", status_code=303)
+
@@ -0,0 +1,15 @@
+from fastapi.staticfiles import StaticFiles
+
+from app.core.config import settings
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles gère déjà ETag / Last-Modified et les 304 ;
+    on ajoute le Cache-Control configuré.
+    """
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault("Cache-Control", settings.CACHE_CONTROL_STATIC)
+        return response
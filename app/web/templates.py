@@ -0,0 +1,34 @@
+import threading
+
+from app.core.startup import timed_phase
+
+
+class LazyTemplates:
+    """
+    Jinja2Templates construit au premier rendu : jinja2 n'est pas importé
+    au démarrage, /health et l'API JSON n'en ont pas besoin.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._templates = None
+
+    def _get(self):
+        if self._templates is None:
+            with self._lock:
+                if self._templates is None:
+                    with timed_phase("templates"):
+                        from fastapi.templating import Jinja2Templates
+
+                        self._templates = Jinja2Templates(directory=self.directory)
+        return self._templates
+
+    def TemplateResponse(self, *args, **kwargs):
+        return self._get().TemplateResponse(*args, **kwargs)
+
+    def get_template(self, name: str):
+        return self._get().get_template(name)
+
+
+templates = LazyTemplates("templates")
@@ -0,0 +1,304 @@
+"""
+Benchmark des parcours public / élève / admin.
+
+Lance app.main:app en process (TestClient) sur une base dédiée, la remplit
+puis mesure chaque scénario : p50 / p95 / p99, débit et requêtes SQL par
+requête HTTP.
+
+    python -m bench.run                                 # SQLite temporaire
+    BENCH_DATABASE_URL=postgresql+psycopg2://... python -m bench.run --users 5000
+    python -m bench.run --save-baseline                 # met à jour bench/baseline.json
+    python -m bench.run --check                         # échoue si régression vs baseline
+
+La base cible est vidée puis remplie : ne jamais pointer sur la production.
+"""
+import argparse
+import contextvars
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE_PATH = ROOT / "bench" / "baseline.json"
+
+STUDENT_PASSWORD = "bench-password"
+ADMIN_EMAIL = "bench-admin@ghayamathia.com"
+
+
+def configure_env(database_url: str | None) -> str:
+    if not database_url:
+        database_url = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db")
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("JWT_SECRET", "bench-secret")
+    os.environ["ENV"] = "bench"  # cookies non "secure" pour le client de test
+    os.environ["ADMIN_EMAIL"] = ADMIN_EMAIL
+    os.environ["ADMIN_PASSWORD"] = STUDENT_PASSWORD
+    os.environ["ADMIN_BOOTSTRAP_ON_STARTUP"] = "false"
+    # tous les clients viennent de la même IP : le scénario login serait limité
+    os.environ["RATE_LIMIT_ENABLED"] = "false"
+    return database_url
+
+
+def seed(users: int, courses: int, enrollments: int) -> None:
+    from sqlalchemy import insert
+
+    from app.core.security import hash_password
+    from app.db.base import Base
+    from app.db.session import engine
+    from app.models.course import Course
+    from app.models.enrollment import Enrollment
+    from app.models.user import User
+
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    # un seul hash bcrypt partagé : le seed reste rapide
+    hashed = hash_password(STUDENT_PASSWORD)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [
+            {"email": ADMIN_EMAIL, "hashed_password": hashed, "role": "admin", "is_active": True}
+        ] + [
+            {"email": f"student{i}@bench.local", "hashed_password": hashed, "role": "user", "is_active": True}
+            for i in range(users)
+        ])
+        conn.execute(insert(Course), [
+            {
+                "title": f"Cours {i}",
+                "description": "Chapitre complet avec exercices corrigés. " * 4,
+                "level": ("collège", "lycée", "bac")[i % 3],
+                "duration_minutes": 30 + (i % 4) * 15,
+                "price_eur": (i % 5) * 10,
+                "published": i % 10 != 0,
+            }
+            for i in range(courses)
+        ])
+        rows, seen = [], set()
+        for i in range(enrollments):
+            pair = (2 + i % users, 1 + (i * 7) % courses)
+            if pair in seen:
+                continue
+            seen.add(pair)
+            rows.append({"user_id": pair[0], "course_id": pair[1],
+                         "status": ("pending", "accepted", "rejected")[i % 3]})
+        if rows:
+            conn.execute(insert(Enrollment), rows)
+
+
+_query_box: contextvars.ContextVar[list[int] | None] = contextvars.ContextVar("bench_queries", default=None)
+
+
+class QueryCountingApp:
+    """
+    Enveloppe ASGI : compte les requêtes SQL émises pendant chaque requête HTTP
+    (contextvar, propagée au threadpool) et renvoie le total dans X-Bench-Queries.
+    """
+
+    def __init__(self, app, engine) -> None:
+        from sqlalchemy import event
+
+        self.app = app
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    @staticmethod
+    def _on_execute(*args, **kwargs) -> None:
+        box = _query_box.get()
+        if box is not None:
+            box[0] += 1
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        box = [0]
+        token = _query_box.set(box)
+
+        async def send_with_count(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-bench-queries", str(box[0]).encode())
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_count)
+        finally:
+            _query_box.reset(token)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def login(client, email: str) -> None:
+    r = client.post("/login", data={"email": email, "password": STUDENT_PASSWORD}, follow_redirects=False)
+    assert r.status_code == 303, r.status_code
+
+
+def build_scenarios(courses: int, users: int) -> dict:
+    published = [i for i in range(1, courses + 1) if (i - 1) % 10 != 0]
+
+    def home(client, i):
+        return client.get("/")
+
+    def catalog(client, i):
+        return client.get("/courses")
+
+    def course_detail(client, i):
+        return client.get(f"/courses/{published[i % len(published)]}")
+
+    def login_scenario(client, i):
+        return client.post(
+            "/login",
+            data={"email": f"student{i % users}@bench.local", "password": STUDENT_PASSWORD},
+            follow_redirects=False,
+        )
+
+    def enroll(client, i):
+        return client.post(f"/courses/{published[i % len(published)]}/enroll", follow_redirects=False)
+
+    def admin_enrollments(client, i):
+        return client.get("/admin/enrollments")
+
+    # (fonction, rôle connecté, nombre de requêtes par défaut)
+    return {
+        "home": (home, None, 300),
+        "catalog": (catalog, None, 300),
+        "course_detail": (course_detail, "student", 300),
+        "login": (login_scenario, None, 20),  # bcrypt : volontairement court
+        "enroll": (enroll, "student", 200),
+        "admin_enrollments": (admin_enrollments, "admin", 100),
+    }
+
+
+def run_scenario(app, fn, role, requests: int, concurrency: int) -> dict:
+    from fastapi.testclient import TestClient
+
+    def worker(worker_id: int, count: int) -> list[tuple[float, int, int]]:
+        samples = []
+        with TestClient(app) as client:
+            if role == "admin":
+                login(client, ADMIN_EMAIL)
+            elif role == "student":
+                login(client, f"student{worker_id}@bench.local")
+            for i in range(count):
+                started = time.perf_counter()
+                r = fn(client, worker_id * count + i)
+                elapsed = time.perf_counter() - started
+                samples.append((elapsed, int(r.headers.get("x-bench-queries", 0)), r.status_code))
+        return samples
+
+    per_worker = max(1, requests // concurrency)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda w: worker(w, per_worker), range(concurrency)))
+    wall = time.perf_counter() - started
+
+    samples = [s for batch in results for s in batch]
+    latencies = [s[0] * 1000 for s in samples]
+    errors = sum(1 for s in samples if s[2] >= 500)
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "mean_ms": round(statistics.fmean(latencies), 3),
+        "throughput_rps": round(len(samples) / wall, 1),
+        "queries_per_request": round(statistics.fmean(s[1] for s in samples), 2),
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for name, current in results.items():
+        ref = baseline.get("scenarios", {}).get(name)
+        if not ref:
+            continue
+        if current["p95_ms"] > ref["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {current['p95_ms']} ms > {ref['p95_ms']} ms (+{tolerance:.0%})")
+        if current["queries_per_request"] > ref["queries_per_request"] + 0.01:
+            regressions.append(
+                f"{name}: {current['queries_per_request']} requêtes SQL/req > {ref['queries_per_request']}"
+            )
+        if current["errors"] > ref.get("errors", 0):
+            regressions.append(f"{name}: {current['errors']} erreurs 5xx")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--courses", type=int, default=50)
+    parser.add_argument("--enrollments", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--requests", type=int, default=None, help="remplace le nombre par défaut de chaque scénario")
+    parser.add_argument("--scenario", action="append", help="à répéter ; par défaut tous")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--check", action="store_true", help="code retour 1 si régression vs baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="marge sur le p95 (0.25 = +25 %%)")
+    parser.add_argument("--output", type=Path, default=None, help="écrit les résultats JSON")
+    args = parser.parse_args(argv)
+
+    database_url = configure_env(os.environ.get("BENCH_DATABASE_URL"))
+    sys.path.insert(0, str(ROOT))
+    os.chdir(ROOT)  # templates/ et static/ sont relatifs
+
+    seed(args.users, args.courses, args.enrollments)
+
+    from app.db.session import engine
+    from app.main import app
+
+    app = QueryCountingApp(app, engine)
+    scenarios = build_scenarios(args.courses, args.users)
+    selected = args.scenario or list(scenarios)
+
+    results = {}
+    for name in selected:
+        fn, role, default_requests = scenarios[name]
+        results[name] = run_scenario(
+            app, fn, role, args.requests or default_requests, args.concurrency
+        )
+        r = results[name]
+        print(
+            f"{name:<18} n={r['requests']:<5} p50={r['p50_ms']:>8.2f}ms p95={r['p95_ms']:>8.2f}ms "
+            f"p99={r['p99_ms']:>8.2f}ms {r['throughput_rps']:>8.1f} req/s "
+            f"sql/req={r['queries_per_request']:<5} 5xx={r['errors']}"
+        )
+
+    report = {
+        "database": database_url.split("://", 1)[0],
+        "volumes": {"users": args.users, "courses": args.courses, "enrollments": args.enrollments},
+        "concurrency": args.concurrency,
+        "scenarios": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+    if args.save_baseline:
+        BASELINE_PATH.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"baseline écrite dans {BASELINE_PATH}")
+
+    if args.check:
+        if not BASELINE_PATH.exists():
+            print("pas de baseline : lancer d'abord --save-baseline")
+            return 1
+        baseline = json.loads(BASELINE_PATH.read_text())
+        mismatched = [k for k in ("database", "volumes", "concurrency") if baseline.get(k) != report[k]]
+        if mismatched:
+            print(f"configuration différente de la baseline ({', '.join(mismatched)}) : comparaison impossible")
+            return 1
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print("RÉGRESSION", line)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
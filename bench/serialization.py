@@ -0,0 +1,65 @@
+"""
+Octets et CPU par réponse catalogue (GET /api/courses) selon le mode de
+sérialisation (standard / FAST_JSON) et l'encodage (identity / gzip / br).
+
+    python -m bench.serialization --courses 500 --requests 300
+"""
+import argparse
+import os
+import sys
+import time
+
+from bench.run import ROOT, configure_env, seed
+
+ENCODINGS = ("identity", "gzip", "br")
+
+
+def measure(client, path: str, encoding: str, requests: int) -> tuple[int, float]:
+    headers = {"Accept-Encoding": encoding}
+    client.get(path, headers=headers)  # échauffement (cache catalogue)
+
+    size = 0
+    cpu_started = time.process_time()
+    for _ in range(requests):
+        r = client.get(path, headers=headers)
+        assert r.status_code == 200, r.status_code
+        size = int(r.headers.get("content-length") or len(r.content))
+    cpu_per_request = (time.process_time() - cpu_started) / requests
+    return size, cpu_per_request
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--courses", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=300)
+    args = parser.parse_args(argv)
+
+    configure_env(os.environ.get("BENCH_DATABASE_URL"))
+    sys.path.insert(0, str(ROOT))
+    os.chdir(ROOT)
+    seed(users=1, courses=args.courses, enrollments=0)
+
+    from fastapi.testclient import TestClient
+
+    from app.core.config import settings
+    from app.main import create_app
+
+    path = f"/api/courses?limit={args.courses}"
+    rows = []
+    for fast in (False, True):
+        # default_response_class est choisie dans create_app() : une app par mode
+        settings.FAST_JSON = fast
+        with TestClient(create_app()) as client:
+            for encoding in ENCODINGS:
+                size, cpu = measure(client, path, encoding, args.requests)
+                rows.append(("FAST_JSON" if fast else "standard", encoding, size, cpu))
+
+    base_cpu = rows[0][3]
+    print(f"{'mode':<10} {'encodage':<9} {'octets':>9} {'CPU/req':>10} {'vs standard':>12}")
+    for mode, encoding, size, cpu in rows:
+        print(f"{mode:<10} {encoding:<9} {size:>9} {cpu * 1000:>8.3f}ms {base_cpu / cpu:>11.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
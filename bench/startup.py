@@ -0,0 +1,153 @@
+"""
+Démarrage à froid d'un worker : temps d'import par module et phases internes
+(/health/startup), chacun mesuré dans un process Python neuf.
+
+    python -m bench.startup                       # rapport
+    python -m bench.startup --top 30
+    python -m bench.startup --budget-ms 1500      # code de sortie 1 si dépassé
+
+Vérifie aussi que l'import de app.main ne charge ni le moteur SQLAlchemy, ni
+Jinja2, ni les bibliothèques crypto (construits au premier usage) : code de
+sortie 1 sinon. Le budget fixe et ces vérifications sont aussi des tests :
+tests/test_startup.py.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from bench.run import ROOT, configure_env
+
+# chargés au premier usage, jamais par l'import de app.main
+LAZY_MODULES = ("jinja2", "jose", "passlib", "cryptography", "psycopg2", "bcrypt")
+
+
+def _child() -> None:
+    """Exécuté dans le process mesuré : import, lifespan, première requête."""
+    started = time.perf_counter()
+    from app.main import app
+    imported = time.perf_counter()
+
+    from app.core.startup import startup_timings
+
+    phases_after_import = dict(startup_timings)
+    loaded = [m for m in LAZY_MODULES if m in sys.modules]
+
+    # client de test importé hors mesure (httpx)
+    from fastapi.testclient import TestClient
+
+    client = TestClient(app)
+    ready_started = time.perf_counter()
+    with client:
+        status = client.get("/health").status_code
+    ready = time.perf_counter() - ready_started
+
+    print(json.dumps({
+        "import_ms": round((imported - started) * 1000, 2),
+        "first_request_ms": round(ready * 1000, 2),
+        "phases_after_import": phases_after_import,
+        "phases": dict(startup_timings),
+        "eager_modules": loaded,
+        "status": status,
+    }))
+
+
+def measure(runs: int) -> list[dict]:
+    results = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-m", "bench.startup", "--child"],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        )
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return results
+
+
+def import_profile() -> list[tuple[str, int, int]]:
+    """(module, self µs, cumulé µs) d'après python -X importtime."""
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def print_profile(rows: list[tuple[str, int, int]], top: int) -> None:
+    by_package: dict[str, int] = defaultdict(int)
+    for name, self_us, _ in rows:
+        by_package[name.split(".")[0]] += self_us
+    total = sum(by_package.values())
+
+    print(f"\nimports : {total / 1000:.1f} ms au total (python -X importtime, surestimé)")
+    print("par paquet (temps propre) :")
+    for package, self_us in sorted(by_package.items(), key=lambda kv: -kv[1])[:top]:
+        print(f"  {package:<28} {self_us / 1000:>8.1f} ms  {100 * self_us / total:>5.1f} %")
+
+    print("modules app.* (cumulé) :")
+    app_rows = sorted((r for r in rows if r[0].startswith("app.")), key=lambda r: -r[2])
+    for name, _, cumulative_us in app_rows[:top]:
+        print(f"  {name:<40} {cumulative_us / 1000:>8.1f} ms")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=None, help="import + lifespan + première requête (médiane)")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        _child()
+        return 0
+
+    configure_env(os.environ.get("BENCH_DATABASE_URL"))
+    sys.path.insert(0, str(ROOT))
+    os.chdir(ROOT)
+
+    # schéma seul : le lifespan (outbox) interroge la base
+    from app import models  # noqa: F401
+    from app.db.base import Base
+    from app.db.session import dispose_engine, get_engine
+
+    Base.metadata.create_all(get_engine())
+    dispose_engine()
+
+    results = measure(args.runs)
+    import_ms = statistics.median(r["import_ms"] for r in results)
+    first_ms = statistics.median(r["first_request_ms"] for r in results)
+    total_ms = statistics.median(r["import_ms"] + r["first_request_ms"] for r in results)
+
+    print(f"import app.main      {import_ms:>8.1f} ms  (médiane sur {args.runs})")
+    print(f"lifespan + /health   {first_ms:>8.1f} ms")
+    print(f"démarrage à froid    {total_ms:>8.1f} ms")
+    print("phases :", ", ".join(f"{k}={v:.1f}ms" for k, v in results[-1]["phases"].items()))
+
+    print_profile(import_profile(), args.top)
+
+    failures = 0
+    last = results[-1]
+    if last["eager_modules"]:
+        failures += 1
+        print(f"\nKO modules chargés dès l'import : {', '.join(last['eager_modules'])}")
+    if "engine" in last["phases_after_import"]:
+        failures += 1
+        print("\nKO moteur SQLAlchemy créé à l'import")
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        failures += 1
+        print(f"\nKO démarrage à froid {total_ms:.1f} ms > budget {args.budget_ms:.0f} ms")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
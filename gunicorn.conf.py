@@ -0,0 +1,136 @@
+"""
+Lancement en production : gunicorn + workers uvicorn (voir start.sh).
+
+Le process maître importe l'application une seule fois (preload_app), applique
+les migrations et le bootstrap admin, puis forke les workers qui partagent le
+code chargé en copy-on-write. Chaque worker repart avec des pools SQLAlchemy
+vides : une connexion ouverte avant le fork ne doit jamais être partagée.
+
+Rechargement progressif : kill -HUP <pid du maître> remplace les workers un par
+un (nouveaux workers démarrés, anciens arrêtés proprement). Avec preload_app le
+code n'est pas relu : pour déployer une nouvelle version, redémarrer le maître
+(ou USR2 puis TERM sur l'ancien maître).
+"""
+import os
+import subprocess
+import sys
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _available_cpus() -> int:
+    # respecte l'affinité CPU du conteneur, contrairement à os.cpu_count()
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+# -------------------------
+# Workers
+# -------------------------
+# workers async : un par CPU suffit (les routes sync passent par le threadpool)
+workers = _env_int("WEB_CONCURRENCY", min(_available_cpus(), _env_int("GUNICORN_MAX_WORKERS", 8)))
+worker_class = "uvicorn.workers.UvicornWorker"
+bind = f"0.0.0.0:{os.environ.get('PORT', '7860')}"
+
+# lu par Settings dans le maître (preload) : pool_sizing() partage
+# DB_MAX_CONNECTIONS entre les workers réellement lancés
+os.environ["WEB_CONCURRENCY"] = str(workers)
+
+# plusieurs workers : caches (catalogue, utilisateurs) et flux SSE doivent
+# passer par la base, sinon une écriture n'est visible que du worker qui l'a traitée
+_MULTI_WORKER_SETTINGS = ("CATALOG_CACHE_SHARED_VERSION", "AUTH_CACHE_SHARED_VERSION", "SSE_PG_NOTIFY")
+if workers > 1:
+    for _name in _MULTI_WORKER_SETTINGS:
+        if _name not in os.environ:
+            os.environ[_name] = "true"
+        elif not _env_bool(_name, True):
+            raise RuntimeError(
+                f"{_name}=false is not supported with {workers} workers: "
+                "set WEB_CONCURRENCY=1 or enable it"
+            )
+
+# le bootstrap admin est fait une fois dans le maître (on_starting)
+RUN_BOOTSTRAP = _env_bool("ADMIN_BOOTSTRAP_ON_STARTUP", False)
+os.environ["ADMIN_BOOTSTRAP_ON_STARTUP"] = "false"
+
+RUN_MIGRATIONS = _env_bool("RUN_MIGRATIONS", True)
+
+preload_app = True
+
+# recyclage des workers (fuites mémoire, fragmentation) ; la gigue évite
+# que tous les workers redémarrent en même temps
+max_requests = _env_int("GUNICORN_MAX_REQUESTS", 5000)
+max_requests_jitter = _env_int("GUNICORN_MAX_REQUESTS_JITTER", max_requests // 10)
+
+graceful_timeout = _env_int("GUNICORN_GRACEFUL_TIMEOUT", 30)
+timeout = _env_int("GUNICORN_TIMEOUT", 60)
+keepalive = _env_int("GUNICORN_KEEPALIVE", 5)
+
+# SIGTERM ferme les flux SSE tout de suite, mais un worker recyclé par
+# max_requests attend la fin de ses flux : ils doivent durer moins que
+# graceful_timeout, sinon le worker finit en SIGKILL
+_sse_limit = graceful_timeout - 5
+if "SSE_MAX_STREAM_SECONDS" not in os.environ:
+    os.environ["SSE_MAX_STREAM_SECONDS"] = str(max(5, _sse_limit))
+elif float(os.environ["SSE_MAX_STREAM_SECONDS"]) > _sse_limit:
+    raise RuntimeError(
+        f"SSE_MAX_STREAM_SECONDS={os.environ['SSE_MAX_STREAM_SECONDS']} must stay below "
+        f"graceful_timeout ({graceful_timeout} s) minus a 5 s margin"
+    )
+
+# derrière le proxy de l'hébergeur (X-Forwarded-For / -Proto)
+forwarded_allow_ips = os.environ.get("FORWARDED_ALLOW_IPS", "127.0.0.1")
+
+accesslog = "-" if _env_bool("GUNICORN_ACCESS_LOG", False) else None
+errorlog = "-"
+loglevel = os.environ.get("LOG_LEVEL", "info")
+
+
+# -------------------------
+# Hooks
+# -------------------------
+def on_starting(server):
+    """Une seule fois, dans le maître, avant le fork des workers."""
+    if RUN_MIGRATIONS:
+        server.log.info("Running alembic upgrade head")
+        # process séparé : env.py reconfigure le logging (fileConfig)
+        subprocess.run([sys.executable, "-m", "alembic", "upgrade", "head"], check=True)
+
+    from app.db.session import SessionLocal, dispose_engine
+
+    if RUN_BOOTSTRAP:
+        from app.db.init_db import ensure_admin
+
+        db = SessionLocal()
+        try:
+            ensure_admin(db)
+        finally:
+            db.close()
+
+    # aucune connexion du maître ne doit être héritée par les workers
+    dispose_engine()
+
+
+def post_fork(server, worker):
+    """Pools réinitialisés sans fermer les connexions (éventuelles) du parent."""
+    from app.db.session import dispose_engine
+
+    dispose_engine(close=False)
+
+    async_session = sys.modules.get("app.db.async_session")
+    if async_session is not None:
+        async_session.async_engine.sync_engine.dispose(close=False)
+
+    server.log.info("Worker %s: database pools reset after fork", worker.pid)
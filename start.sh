@@ -0,0 +1,19 @@
+#!/bin/sh
+# Point d'entrée production : gunicorn (maître) + workers uvicorn.
+# Réglages dans gunicorn.conf.py ; variables utiles :
+#   WEB_CONCURRENCY        nombre de workers (défaut : un par CPU, max GUNICORN_MAX_WORKERS)
+#                          au-delà d'un worker, CATALOG_CACHE_SHARED_VERSION, AUTH_CACHE_SHARED_VERSION
+#                          et SSE_PG_NOTIFY sont activés d'office (les forcer à false refuse le démarrage)
+#   RUN_MIGRATIONS         alembic upgrade head avant le fork (défaut : true)
+#   ADMIN_BOOTSTRAP_ON_STARTUP  crée ou met à jour le compte admin (défaut : false)
+#   GUNICORN_MAX_REQUESTS  recyclage d'un worker après N requêtes (défaut : 5000)
+#   PORT                   port d'écoute (défaut : 7860)
+#   FORWARDED_ALLOW_IPS    adresses des proxys dont uvicorn applique X-Forwarded-For
+#                          (défaut : 127.0.0.1). Derrière le proxy de l'hébergeur, à
+#                          renseigner (ou RATE_LIMIT_TRUST_FORWARDED_FOR=true) : sinon
+#                          la limitation login / register voit tous les clients sous
+#                          l'adresse du proxy (un avertissement est journalisé)
+# Rechargement progressif des workers : kill -HUP <pid du maître>
+set -e
+
+exec gunicorn -c gunicorn.conf.py app.main:app
@@ -0,0 +1,21 @@
+"""
+Tests d'intégration sur une base dédiée : SQLite temporaire par défaut,
+ou BENCH_DATABASE_URL (PostgreSQL pour les tests de plans d'exécution).
+
+    python -m pytest tests
+    BENCH_DATABASE_URL=postgresql+psycopg2://... python -m pytest tests
+
+Chaque test vide puis remplit la base : ne jamais pointer sur la production.
+"""
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+from bench.run import configure_env  # noqa: E402
+
+# Settings est instancié à l'import de app.* : avant la collecte des tests
+configure_env(os.environ.get("BENCH_DATABASE_URL"))
@@ -0,0 +1,106 @@
+"""
+Clics concurrents sur « S'inscrire » : N threads inscrivent le même élève
+au même cours. Une seule inscription, un seul événement enrollment.created,
+et la même inscription renvoyée à tous les appels.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+
+from bench.run import login, seed
+
+THREADS = 16
+
+
+@pytest.fixture
+def courses():
+    # seed : 1 cours sur 10 est un brouillon, on ne garde que des cours publiés
+    seed(users=2, courses=10, enrollments=0)
+
+    from app.db.session import SessionLocal
+    from app.models.course import Course
+    from app.models.user import User
+
+    db = SessionLocal()
+    try:
+        student_id = db.scalar(select(User.id).where(User.email == "student0@bench.local"))
+        course_ids = db.scalars(
+            select(Course.id).where(Course.published == True).order_by(Course.id)  # noqa: E712
+        ).all()
+    finally:
+        db.close()
+    return student_id, course_ids
+
+
+def _counts(course_id: int) -> tuple[int, int]:
+    from app.db.session import SessionLocal
+    from app.models.enrollment import Enrollment
+    from app.models.outbox import OutboxEvent
+
+    db = SessionLocal()
+    try:
+        rows = db.scalar(
+            select(func.count()).select_from(Enrollment).where(Enrollment.course_id == course_id)
+        )
+        events = sum(
+            1 for payload in db.scalars(
+                select(OutboxEvent.payload).where(OutboxEvent.kind == "enrollment.created")
+            )
+            if payload["course_id"] == course_id
+        )
+    finally:
+        db.close()
+    return rows, events
+
+
+def test_concurrent_enroll_calls(courses):
+    from app.core.enrollments import enroll
+    from app.db.session import SessionLocal
+
+    student_id, course_ids = courses
+    course_id = course_ids[0]
+    barrier = threading.Barrier(THREADS)
+
+    def hit(_):
+        db = SessionLocal()
+        try:
+            barrier.wait()
+            e, created = enroll(db, student_id, course_id)
+            return e.id, created
+        finally:
+            db.close()
+
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        results = list(pool.map(hit, range(THREADS)))
+
+    assert len({enrollment_id for enrollment_id, _ in results}) == 1
+    assert sum(created for _, created in results) == 1
+    assert _counts(course_id) == (1, 1)
+
+
+def test_concurrent_enroll_requests(courses):
+    from app.main import app
+
+    _, course_ids = courses
+    course_id = course_ids[1]
+    barrier = threading.Barrier(THREADS)
+
+    with TestClient(app) as client:
+        # cookie de session : accepté par le site et par l'API
+        login(client, "student0@bench.local")
+
+        def hit(i: int):
+            barrier.wait()
+            if i % 2:
+                return client.post(f"/courses/{course_id}/enroll", follow_redirects=False)
+            return client.post("/api/enrollments", json={"course_id": course_id})
+
+        with ThreadPoolExecutor(max_workers=THREADS) as pool:
+            responses = list(pool.map(hit, range(THREADS)))
+
+    assert [r.status_code for r in responses if r.status_code >= 500] == []
+    assert len({r.json()["id"] for r in responses if r.status_code == 200}) == 1
+    assert _counts(course_id) == (1, 1)
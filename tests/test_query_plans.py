@@ -0,0 +1,68 @@
+"""
+Le planificateur PostgreSQL utilise les index du catalogue (ix_courses_*)
+pour les requêtes filtrées, sur une base remplie.
+"""
+import os
+
+import pytest
+from sqlalchemy import select
+
+from bench.run import seed
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("BENCH_DATABASE_URL", "").startswith("postgresql"),
+    reason="BENCH_DATABASE_URL (PostgreSQL) non défini",
+)
+
+SEED_COURSES = 20000
+
+
+def _filters(**values):
+    from app.api.filters import CourseFilters
+
+    params = dict(level=None, min_price=None, max_price=None, min_duration=None, max_duration=None)
+    params.update(values)
+    return CourseFilters(**params)
+
+
+def _plans():
+    from app.models.course import Course
+
+    published = Course.published == True  # noqa: E712
+    return {
+        "ix_courses_published_id": select(Course.id).where(published).order_by(Course.id.desc()),
+        "ix_courses_level_price": select(Course.id).where(
+            *_filters(level="bac", min_price=10, max_price=10).criteria()
+        ),
+        "ix_courses_published_duration": select(Course.id).where(
+            published, *_filters(min_duration=30, max_duration=30).criteria()
+        ),
+    }
+
+
+@pytest.fixture(scope="module")
+def conn():
+    seed(users=1, courses=SEED_COURSES, enrollments=0)
+
+    from app.db.session import get_engine
+
+    with get_engine().connect() as conn:
+        # statistiques à jour, sinon le planificateur ignore les index
+        conn.exec_driver_sql("ANALYZE")
+        yield conn
+
+
+def _explain(conn, stmt) -> str:
+    compiled = stmt.compile(conn, compile_kwargs={"literal_binds": True})
+    rows = conn.exec_driver_sql("EXPLAIN " + str(compiled)).all()
+    return "\n".join(str(r[0]) for r in rows)
+
+
+@pytest.mark.parametrize("index", [
+    "ix_courses_published_id",
+    "ix_courses_level_price",
+    "ix_courses_published_duration",
+])
+def test_catalog_query_uses_index(conn, index):
+    plan = _explain(conn, _plans()[index])
+    assert index in plan, plan
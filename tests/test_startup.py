@@ -0,0 +1,41 @@
+"""
+Démarrage à froid d'un worker, mesuré dans des process Python neufs
+(rapport détaillé : python -m bench.startup).
+"""
+import statistics
+
+import pytest
+
+from bench.startup import measure
+
+# import app.main + lifespan + premier /health (médiane)
+COLD_START_BUDGET_MS = 3000
+RUNS = 3
+
+
+@pytest.fixture(scope="module")
+def runs():
+    # schéma seul : le lifespan (outbox) interroge la base
+    from app.db.base import Base
+    from app.db.session import dispose_engine, get_engine
+
+    Base.metadata.create_all(get_engine())
+    dispose_engine()
+    return measure(RUNS)
+
+
+def test_cold_start_budget(runs):
+    assert all(r["status"] == 200 for r in runs)
+    total_ms = statistics.median(r["import_ms"] + r["first_request_ms"] for r in runs)
+    assert total_ms <= COLD_START_BUDGET_MS
+
+
+@pytest.mark.parametrize("module", ["jinja2", "passlib", "jose"])
+def test_heavy_module_not_imported(runs, module):
+    assert module not in runs[-1]["eager_modules"]
+
+
+def test_lazy_construction(runs):
+    # ni moteur SQLAlchemy ni autre bibliothèque différée à l'import de app.main
+    assert "engine" not in runs[-1]["phases_after_import"]
+    assert runs[-1]["eager_modules"] == []